@@ -5,34 +5,175 @@ import argparse
 # Ensure src is in python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def main():
-    parser = argparse.ArgumentParser(description="Sulhwasoo Review Crawler")
-    parser.add_argument("--site", type=str, default="apmall", help="Target site to crawl (default: apmall)")
-    args = parser.parse_args()
+def add_sinks(crawler, store_names):
+    """Attach the review stores requested with --store to a crawler."""
+    from src.core.review_store import create_sinks
+
+    for sink in create_sinks(store_names):
+        crawler.add_sink(sink)
+
+def configure_output(crawler, args):
+    """Apply --format / --compress to a crawler's streaming writer."""
+    if args.format:
+        crawler.output_format = args.format
+    if args.compress:
+        crawler.output_compression = args.compress
+
+def attach_job_queue(crawler, args):
+    """Share the target list through the lease-based job queue given with --queue."""
+    if crawler is not None and args.queue:
+        from src.core.job_queue import JobQueue
+
+        crawler.job_queue = JobQueue(args.queue, args.queue_db)
+    return crawler
 
-    if args.site == "apmall":
+def create_crawler(site, args):
+    """Build the crawler for one site from the command-line options."""
+    if site == "apmall":
         # Import lazily to avoid errors if module is missing
         try:
             from src.sites.apmall.crawler import APMallCrawler
             print("Initializing AP Mall Crawler...")
-            crawler = APMallCrawler()
-            crawler.run()
+            options = {}
+            if args.workers is not None:
+                options["workers"] = args.workers
+            if args.window is not None:
+                options["window"] = args.window
+            if args.incremental:
+                options["incremental"] = True
+            crawler = APMallCrawler(**options)
+            configure_output(crawler, args)
+            add_sinks(crawler, args.store)
+            return attach_job_queue(crawler, args)
         except ImportError as e:
             print(f"Error loading APMallCrawler: {e}")
-            
-    elif args.site == "naver":
+
+    elif site == "naver":
         try:
             from src.sites.naver.crawler import NaverCrawler
             print("Initializing Naver Crawler...")
-            crawler = NaverCrawler()
-            crawler.run()
+            crawler = NaverCrawler(
+                incremental=args.incremental,
+                workers=args.workers,
+                headless=True if args.headless else None,
+                reset_profile=args.reset_profile,
+            )
+            configure_output(crawler, args)
+            add_sinks(crawler, args.store)
+            return attach_job_queue(crawler, args)
         except ImportError as e:
             print(f"Error loading NaverCrawler: {e}")
-            
-    else:
+
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Sulhwasoo Review Crawler")
+    parser.add_argument("command", nargs="?", default="crawl", choices=["crawl", "query", "validate", "normalize", "analyze", "dedup", "search", "download-images", "tokenize", "queue"], help="What to run (default: crawl)")
+    parser.add_argument("--site", type=str, default=None, help="Target site to crawl: apmall, naver, a comma list, or all (default: apmall)")
+    parser.add_argument("--workers", type=int, default=None, help="Number of products to crawl concurrently")
+    parser.add_argument("--window", type=int, default=None, help="Offset requests in flight per product (apmall only)")
+    parser.add_argument("--headless", action="store_true", help="Launch the browser headless (naver only)")
+    parser.add_argument("--reset-profile", action="store_true", help="Recreate the browser profile before crawling (naver only)")
+    parser.add_argument("--store", type=str, default="", help="Extra review stores, comma separated (parquet, sqlite)")
+    parser.add_argument("--format", type=str, default=None, choices=["json", "ndjson"], help="Review output format")
+    parser.add_argument("--compress", type=str, default=None, choices=["gzip", "zstd"], help="Compress review output files")
+    parser.add_argument("--incremental", action="store_true", help="Only fetch reviews added since the last run")
+    parser.add_argument("--queue", type=str, default=None, help="Share targets through this named job queue so several processes or hosts split the crawl (e.g. a date)")
+    parser.add_argument("--queue-db", type=str, default=None, help="Job queue database path, on a directory shared by all hosts (default: data/state/jobs.db)")
+
+    parser.add_argument("--max-size", type=int, default=None, help="Downscale images so the long edge fits this many pixels (download-images)")
+    parser.add_argument("--output", type=str, default=None, help="Output path (normalize, dedup)")
+    parser.add_argument("--text", type=str, default=None, help="Search query (search) or review text to look up near-duplicates for (dedup)")
+
+    query_group = parser.add_argument_group("query options")
+    query_group.add_argument("--db", type=str, default=None, help="SQLite review database path (query) or search index path (search)")
+    query_group.add_argument("--product", type=str, default=None, help="Filter by product id")
+    query_group.add_argument("--min-score", type=int, default=None, help="Minimum score")
+    query_group.add_argument("--max-score", type=int, default=None, help="Maximum score")
+    query_group.add_argument("--since", type=str, default=None, help="Created on or after (YYYY-MM-DD)")
+    query_group.add_argument("--until", type=str, default=None, help="Created before (YYYY-MM-DD)")
+    query_group.add_argument("--new", action="store_true", help="Only reviews first stored by the latest run")
+    query_group.add_argument("--summary", action="store_true", help="Per-product review counts and mean score")
+    query_group.add_argument("--limit", type=int, default=20, help="Maximum rows to print")
+    args = parser.parse_args()
+
+    if args.command == "query":
+        from src.core.review_db import run_query_cli
+        run_query_cli(args)
+        return
+
+    if args.command == "queue":
+        # Per-site job counts (pending / leased / done / failed) for --queue
+        if not args.queue:
+            print("Error: queue requires --queue NAME")
+            sys.exit(1)
+        from src.core.job_queue import run_queue_status_cli
+        run_queue_status_cli(args.queue, site=args.site, path=args.queue_db)
+        return
+
+    if args.command == "validate":
+        # Benchmark schema validation over the stored data/raw corpus
+        from src.core.validation import run_benchmark
+        run_benchmark(sites=[args.site] if args.site else None)
+        return
+
+    if args.command == "normalize":
+        from src.analysis.normalize import run_normalize_cli
+        run_normalize_cli(args.output, sites=[args.site] if args.site else None)
+        return
+
+    if args.command == "analyze":
+        # Incrementally update daily aggregates and redraw data/analysis trend charts
+        from src.analysis.trends import run_analyze_cli
+        run_analyze_cli(sites=[args.site] if args.site else None)
+        return
+
+    if args.command == "tokenize":
+        # Tokenize review bodies across a process pool and update keyword tables
+        from src.analysis.tokens import run_tokenize_cli
+        run_tokenize_cli(sites=[args.site] if args.site else None, workers=args.workers, limit=args.limit)
+        return
+
+    if args.command == "download-images":
+        # Download review photo attachments referenced by data/raw snapshots
+        from src.core.image_downloader import run_download_images_cli
+        run_download_images_cli([args.site] if args.site else ["apmall", "naver"], concurrency=args.workers, max_size=args.max_size)
+        return
+
+    if args.command == "search":
+        # Full-text search over review bodies (index is refreshed first)
+        from src.analysis.search import run_search_cli
+        run_search_cli(args)
+        return
+
+    if args.command == "dedup":
+        # Near-duplicate review clusters, or lookup for --text
+        from src.analysis.dedup import run_dedup_cli
+        run_dedup_cli(sites=[args.site] if args.site else None, text=args.text, output_path=args.output, limit=args.limit)
+        return
+
+    args.site = args.site or "apmall"
+
+    if args.site == "all" or "," in args.site:
+        # Run several site crawlers at once, one process per site
+        from src.core.multi_site import SITES, parse_sites, run_sites
+        sites = parse_sites(args.site)
+        unknown = [site for site in sites if site not in SITES]
+        if unknown:
+            print(f"Error: Unknown site '{', '.join(unknown)}'")
+            sys.exit(1)
+        run_sites(sites, args, create_crawler)
+        print("\nCrawling completed.")
+        return
+
+    if args.site not in ("apmall", "naver"):
         print(f"Error: Unknown site '{args.site}'")
         sys.exit(1)
 
+    crawler = create_crawler(args.site, args)
+    if crawler is not None:
+        crawler.run()
+
     print("\nCrawling completed.")
 
 if __name__ == "__main__":
@@ -0,0 +1,300 @@
+# src/analysis/dedup.py
+"""
+리뷰 본문 유사 중복 탐지 (MinHash + LSH).
+
+본문을 공백 · 기호를 뺀 문자 3-gram 집합으로 보고, NUM_PERM개의 해시 함수로 MinHash
+시그니처를 만든 뒤 BANDS개 밴드로 나눠 버킷에 넣습니다. 같은 버킷에 들어간 후보끼리만
+시그니처 일치율(= 추정 Jaccard 유사도)을 비교하므로 전체 쌍 비교 없이 중복을 찾습니다.
+
+시그니처와 메타데이터는 data/state/analysis/minhash/ 에 저장하고, 다음 실행에서는
+새로 생기거나 바뀐 스냅샷의 처음 보는 리뷰만 시그니처를 계산해 덧붙입니다.
+"""
+import json
+import os
+import time
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.normalize import SOURCE_FIELDS, changed_snapshot_files, compact_text, load_snapshot_files, mark_processed, normalize_frame
+from src.core.config import DATA_ANALYSIS_DIR
+from src.core.state import load_state, save_state, state_path
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+THRESHOLD = 0.8  # 추정 Jaccard 유사도가 이 값 이상이면 유사 중복
+MIN_CHARS = 15  # "좋아요" 같은 짧은 정형 문구는 중복으로 보지 않음
+CHUNK_SIZE = 2000
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_rng = np.random.RandomState(20251127)  # 시그니처 재사용을 위해 고정 시드
+_PERM_A = _rng.randint(1, _MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, _MERSENNE_PRIME, size=NUM_PERM).astype(np.uint64)
+
+META_COLUMNS = ["site", "review_id", "product", "parent_review_id", "text"]
+
+
+def shingle_hashes(text: str) -> np.ndarray:
+    """정규화된 본문의 문자 n-gram 해시 (중복 제거)"""
+    grams = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash_signatures(texts: List[str]) -> np.ndarray:
+    """정규화된 본문 목록의 MinHash 시그니처 (len(texts) x NUM_PERM, uint32)"""
+    signatures = np.empty((len(texts), NUM_PERM), dtype=np.uint32)
+    for start in range(0, len(texts), CHUNK_SIZE):
+        chunk = [shingle_hashes(text) for text in texts[start:start + CHUNK_SIZE]]
+        lengths = np.array([len(hashes) for hashes in chunk])
+        flat = np.concatenate(chunk)
+        # 모든 shingle에 NUM_PERM개 해시를 한 번에 적용한 뒤 문서 구간별 최솟값
+        permuted = (flat[:, None] * _PERM_A + _PERM_B) % _MERSENNE_PRIME
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        signatures[start:start + len(chunk)] = np.minimum.reduceat(permuted, offsets, axis=0)
+    return signatures
+
+
+def _band_keys(signature: np.ndarray) -> List[Tuple[int, bytes]]:
+    return [(band, signature[band * ROWS:(band + 1) * ROWS].tobytes()) for band in range(BANDS)]
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = np.arange(size)
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+class NearDuplicateIndex:
+    """
+    MinHash 시그니처 + LSH 버킷 인덱스.
+    """
+
+    def __init__(self, directory: Optional[str] = None, threshold: float = THRESHOLD):
+        self.directory = directory or state_path("analysis", "minhash")
+        self.threshold = threshold
+        self.signatures = np.empty((0, NUM_PERM), dtype=np.uint32)
+        self.meta = pd.DataFrame(columns=META_COLUMNS)
+        self.buckets: Dict[Tuple[int, bytes], List[int]] = defaultdict(list)
+        self.processed: Dict[str, list] = {}
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    @property
+    def _signature_path(self) -> str:
+        return os.path.join(self.directory, "signatures.npy")
+
+    @property
+    def _meta_path(self) -> str:
+        return os.path.join(self.directory, "meta.parquet")
+
+    @property
+    def _files_path(self) -> str:
+        return os.path.join(self.directory, "processed_files.json")
+
+    def load(self) -> "NearDuplicateIndex":
+        if os.path.exists(self._signature_path) and os.path.exists(self._meta_path):
+            self.signatures = np.load(self._signature_path)
+            self.meta = pd.read_parquet(self._meta_path)
+            self.processed = load_state(self._files_path, {}) or {}
+        if len(self.signatures) != len(self.meta):
+            print("⚠️  중복 인덱스가 손상되어 처음부터 다시 만듭니다.")
+            self.signatures = np.empty((0, NUM_PERM), dtype=np.uint32)
+            self.meta = pd.DataFrame(columns=META_COLUMNS)
+            self.processed = {}
+        self._rebuild_buckets()
+        return self
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._signature_path + ".tmp.npy"
+        np.save(tmp_path, self.signatures)
+        os.replace(tmp_path, self._signature_path)
+        tmp_path = self._meta_path + ".tmp"
+        self.meta.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self._meta_path)
+        save_state(self._files_path, self.processed)
+
+    def _rebuild_buckets(self):
+        self.buckets = defaultdict(list)
+        for position, signature in enumerate(self.signatures):
+            for key in _band_keys(signature):
+                self.buckets[key].append(position)
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def add(self, table: pd.DataFrame) -> int:
+        """통합 리뷰 테이블에서 처음 보는 리뷰를 인덱스에 추가하고 추가한 개수를 반환"""
+        frame = table[table["review_id"].notna()].drop_duplicates(["site", "review_id"])
+        normalized = frame["text"].fillna("").map(compact_text)
+        frame = frame[normalized.str.len() >= MIN_CHARS]
+        normalized = normalized[frame.index]
+
+        if len(self.meta):
+            known = pd.MultiIndex.from_frame(self.meta[["site", "review_id"]].astype({"review_id": "int64"}))
+            keys = pd.MultiIndex.from_arrays([frame["site"].astype(str), frame["review_id"].astype("int64")])
+            is_new = ~keys.isin(known)
+            frame, normalized = frame[is_new], normalized[is_new]
+        if frame.empty:
+            return 0
+
+        signatures = minhash_signatures(normalized.tolist())
+        start = len(self.signatures)
+        self.signatures = np.vstack([self.signatures, signatures])
+        new_meta = pd.DataFrame(
+            {
+                "site": frame["site"].astype(str).values,
+                "review_id": frame["review_id"].astype("int64").values,
+                "product": frame["product"].astype(str).values,
+                "parent_review_id": frame["parent_review_id"].astype("Int64").values,
+                "text": frame["text"].astype(str).values,
+            }
+        )
+        self.meta = new_meta if self.meta.empty else pd.concat([self.meta, new_meta], ignore_index=True)
+        for offset, signature in enumerate(signatures):
+            for key in _band_keys(signature):
+                self.buckets[key].append(start + offset)
+        return len(frame)
+
+    def update_from_snapshots(self, sites: Optional[List[str]] = None, raw_dir: Optional[str] = None) -> Dict[str, int]:
+        """새로 생기거나 바뀐 스냅샷의 리뷰를 인덱스에 추가"""
+        added = {}
+        for site in sites or list(SOURCE_FIELDS):
+            files = changed_snapshot_files(site, self.processed, raw_dir)
+            added[site] = 0
+            if files:
+                added[site] = self.add(normalize_frame(site, load_snapshot_files(site, files)))
+                mark_processed(self.processed, files)
+        return added
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def query(self, text: str, limit: int = 10) -> List[dict]:
+        """본문과 유사 중복인 리뷰를 유사도 순으로 반환"""
+        normalized = compact_text(text)
+        if len(normalized) < SHINGLE_SIZE:
+            return []
+        signature = minhash_signatures([normalized])[0]
+
+        candidates = set()
+        for key in _band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        if not candidates:
+            return []
+
+        positions = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        similarity = (self.signatures[positions] == signature).mean(axis=1)
+        matched = similarity >= self.threshold
+        order = np.argsort(-similarity[matched])[:limit]
+
+        results = []
+        for position, score in zip(positions[matched][order], similarity[matched][order]):
+            row = self.meta.iloc[position]
+            results.append(
+                {
+                    "site": row["site"],
+                    "product": row["product"],
+                    "review_id": int(row["review_id"]),
+                    "similarity": round(float(score), 3),
+                    "text": row["text"],
+                }
+            )
+        return results
+
+    def clusters(self) -> List[List[int]]:
+        """유사 중복 묶음 (인덱스 위치 목록, 2개 이상만)"""
+        union = _UnionFind(len(self.signatures))
+        for members in self.buckets.values():
+            if len(members) < 2:
+                continue
+            positions = np.array(members)
+            signatures = self.signatures[positions]
+            # 버킷 안에서 첫 번째 것과 비교하고, 나머지는 다른 밴드 버킷에서 다시 만남
+            for i in range(len(positions) - 1):
+                similarity = (signatures[i + 1:] == signatures[i]).mean(axis=1)
+                for j in np.nonzero(similarity >= self.threshold)[0]:
+                    union.union(int(positions[i]), int(positions[i + 1 + j]))
+
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for position in range(len(self.signatures)):
+            groups[union.find(position)].append(position)
+        return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+
+    def cluster_records(self) -> List[dict]:
+        records = []
+        for number, group in enumerate(self.clusters(), start=1):
+            members = self.meta.iloc[group]
+            records.append(
+                {
+                    "cluster": number,
+                    "size": len(group),
+                    "sites": sorted(members["site"].unique().tolist()),
+                    "products": sorted(members["product"].unique().tolist()),
+                    "reviews": [
+                        {
+                            "site": row.site,
+                            "product": row.product,
+                            "review_id": int(row.review_id),
+                            "parent_review_id": None if pd.isna(row.parent_review_id) else int(row.parent_review_id),
+                            "text": row.text,
+                        }
+                        for row in members.itertuples(index=False)
+                    ],
+                }
+            )
+        return records
+
+
+def run_dedup_cli(sites: Optional[List[str]] = None, text: Optional[str] = None, output_path: Optional[str] = None, limit: int = 20):
+    """main.py dedup 처리: 인덱스 증분 갱신 후 중복 묶음 저장, --text면 유사 리뷰 조회"""
+    started = time.perf_counter()
+    index = NearDuplicateIndex().load()
+    added = index.update_from_snapshots(sites)
+    if any(added.values()):
+        index.save()
+    for site, count in added.items():
+        print(f"[{site}] 새 리뷰 {count:,}개 인덱싱")
+    print(f"중복 인덱스: 리뷰 {len(index.meta):,}개 ({time.perf_counter() - started:.2f}s)")
+
+    if text:
+        query_started = time.perf_counter()
+        matches = index.query(text, limit=limit)
+        elapsed_ms = (time.perf_counter() - query_started) * 1000
+        print(f"\n유사 리뷰 {len(matches)}개 ({elapsed_ms:.2f}ms)")
+        for match in matches:
+            snippet = match["text"].replace("\n", " ")[:60]
+            print(f"  {match['similarity']:.2f}  [{match['site']}] {match['product']} #{match['review_id']}  {snippet}")
+        return
+
+    records = index.cluster_records()
+    output_path = output_path or os.path.join(DATA_ANALYSIS_DIR, "duplicate_clusters.json")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+
+    duplicated = sum(record["size"] for record in records)
+    cross_site = sum(1 for record in records if len(record["sites"]) > 1)
+    print(f"중복 묶음 {len(records):,}개 (리뷰 {duplicated:,}개, 사이트 간 {cross_site}개)")
+    for record in records[:limit]:
+        snippet = record["reviews"][0]["text"].replace("\n", " ")[:60]
+        print(f"  {record['size']:>4}건  {','.join(record['sites'])}  상품 {len(record['products'])}개  {snippet}")
+    print(f"저장: {output_path}")
@@ -0,0 +1,183 @@
+# src/analysis/normalize.py
+"""
+사이트별 리뷰 스냅샷을 하나의 통합 테이블로 변환합니다.
+
+레코드 단위 파이썬 루프 대신, 필요한 필드만 골라 DataFrame을 만든 뒤
+컬럼 단위(vectorized) 연산으로 타입 변환과 속성 추출을 처리합니다.
+
+통합 테이블 컬럼:
+    site, product, review_id, ts, score, text, attributes, has_photo,
+    parent_review_id, snapshot
+"""
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.core.config import DATA_ANALYSIS_DIR, DATA_RAW_DIR
+from src.core.review_store import REVIEW_FIELDS
+from src.core.writers import read_reviews, review_output_files
+
+UNIFIED_COLUMNS = [
+    "site",
+    "product",
+    "review_id",
+    "ts",
+    "score",
+    "text",
+    "attributes",
+    "has_photo",
+    "parent_review_id",
+    "snapshot",
+]
+
+# 통합 테이블을 만들 때 읽는 사이트별 원본 필드
+SOURCE_FIELDS = {
+    "apmall": ["prodReviewSn", "prodReviewRegistDt", "scope", "prodReviewBodyText", "userAddAttrInfo", "imgList"],
+    "naver": [
+        "id",
+        "createDate",
+        "reviewScore",
+        "reviewContent",
+        "reviewUserInfoValues",
+        "reviewAttaches",
+        "parentReviewId",
+    ],
+}
+
+_NON_TEXT = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def compact_text(text: Optional[str]) -> str:
+    """본문 비교 · 색인용: 공백 · 기호를 지우고 소문자로 변환 (검색 인덱스, 유사 중복 탐지 공용)"""
+    if not text:
+        return ""
+    return _NON_TEXT.sub("", str(text)).lower()
+
+
+def _join_item_values(column: pd.Series) -> pd.Series:
+    """[{itemValue: ...}, ...] 리스트 컬럼을 '/'로 이은 문자열 컬럼으로 변환"""
+    exploded = column.explode().dropna()
+    if exploded.empty:
+        return pd.Series(pd.NA, index=column.index, dtype="string")
+    values = pd.DataFrame(exploded.tolist(), index=exploded.index).get("itemValue")
+    if values is None:
+        return pd.Series(pd.NA, index=column.index, dtype="string")
+    joined = values.dropna().astype(str).groupby(level=0).agg("/".join)
+    return joined.reindex(column.index).astype("string")
+
+
+def _non_empty(column: pd.Series) -> pd.Series:
+    """리스트 컬럼이 비어 있지 않은지 (결측은 False)"""
+    return column.str.len().fillna(0).gt(0)
+
+
+def normalize_frame(site: str, raw: pd.DataFrame) -> pd.DataFrame:
+    """사이트 원본 필드 DataFrame을 통합 스키마로 변환"""
+    fields = REVIEW_FIELDS[site]
+    frame = pd.DataFrame(index=raw.index)
+    frame["site"] = pd.Series(site, index=raw.index, dtype="category")
+    frame["product"] = raw["product"].astype("string")
+    frame["review_id"] = pd.to_numeric(raw[fields["id"]], errors="coerce").astype("Int64")
+    frame["ts"] = pd.to_datetime(raw[fields["created"]], utc=True, errors="coerce", format="ISO8601")
+    frame["score"] = pd.to_numeric(raw[fields["score"]], errors="coerce").astype("Int8")
+    frame["text"] = raw[fields["text"]].astype("string")
+
+    if site == "apmall":
+        frame["attributes"] = raw["userAddAttrInfo"].astype("string")
+        frame["has_photo"] = _non_empty(raw["imgList"])
+        frame["parent_review_id"] = pd.array([pd.NA] * len(raw), dtype="Int64")
+    else:
+        frame["attributes"] = _join_item_values(raw["reviewUserInfoValues"])
+        frame["has_photo"] = _non_empty(raw["reviewAttaches"])
+        frame["parent_review_id"] = pd.to_numeric(raw["parentReviewId"], errors="coerce").astype("Int64")
+
+    frame["snapshot"] = raw["snapshot"].astype("string")
+    return frame[UNIFIED_COLUMNS]
+
+
+def load_snapshot_files(site: str, files: List[str]) -> pd.DataFrame:
+    """스냅샷 파일들을 읽어 사이트 원본 필드 DataFrame으로 합칩니다."""
+    columns = SOURCE_FIELDS[site]
+    frames = []
+    for file_path in files:
+        records = read_reviews(file_path)
+        if not records:
+            continue
+        frame = pd.DataFrame.from_records(records, columns=columns)
+        frame["product"] = os.path.basename(file_path)[len(f"{site}_reviews_"):].split(".")[0]
+        frame["snapshot"] = os.path.basename(os.path.dirname(file_path))
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=columns + ["product", "snapshot"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def snapshot_files(site: str, raw_dir: Optional[str] = None, snapshot: Optional[str] = None) -> List[str]:
+    """data/raw/<site>/<snapshot>/<site>_reviews_*.json|.jsonl[.gz|.zst] 목록"""
+    return review_output_files(raw_dir or DATA_RAW_DIR, site, snapshot or "*")
+
+
+def changed_snapshot_files(site: str, processed: Dict[str, list], raw_dir: Optional[str] = None) -> List[str]:
+    """processed({경로: [mtime, size]})에 없거나 바뀐 스냅샷 파일 목록"""
+    changed = []
+    for file_path in snapshot_files(site, raw_dir):
+        stat = os.stat(file_path)
+        if processed.get(file_path) != [stat.st_mtime, stat.st_size]:
+            changed.append(file_path)
+    return changed
+
+
+def mark_processed(processed: Dict[str, list], files: List[str]):
+    """처리한 스냅샷 파일의 mtime/size를 processed에 기록"""
+    for file_path in files:
+        stat = os.stat(file_path)
+        processed[file_path] = [stat.st_mtime, stat.st_size]
+
+
+def normalize_tree(
+    raw_dir: Optional[str] = None,
+    sites: Optional[List[str]] = None,
+    dedupe: bool = True,
+) -> pd.DataFrame:
+    """
+    data/raw 전체(또는 일부 사이트)를 통합 테이블로 변환합니다.
+    dedupe=True면 여러 스냅샷에 중복된 리뷰는 가장 최근 스냅샷 것만 남깁니다.
+    """
+    frames = []
+    for site in sites or list(SOURCE_FIELDS):
+        files = snapshot_files(site, raw_dir)
+        if files:
+            frames.append(normalize_frame(site, load_snapshot_files(site, files)))
+
+    if not frames:
+        return pd.DataFrame(columns=UNIFIED_COLUMNS)
+
+    table = pd.concat(frames, ignore_index=True)
+    table["site"] = table["site"].astype("category")
+    if dedupe:
+        table = (
+            table.sort_values("snapshot")
+            .drop_duplicates(["site", "review_id"], keep="last")
+            .sort_values(["site", "product", "ts"], ascending=[True, True, False])
+            .reset_index(drop=True)
+        )
+    return table
+
+
+def run_normalize_cli(output_path: Optional[str] = None, raw_dir: Optional[str] = None, sites: Optional[List[str]] = None):
+    """main.py normalize 처리: 통합 테이블을 Parquet으로 저장하고 소요 시간을 출력"""
+    output_path = output_path or os.path.join(DATA_ANALYSIS_DIR, "reviews_unified.parquet")
+    started = time.perf_counter()
+    table = normalize_tree(raw_dir, sites)
+    elapsed = time.perf_counter() - started
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    table.to_parquet(output_path, index=False)
+
+    counts: Dict[str, int] = table.groupby("site", observed=True).size().to_dict()
+    summary = ", ".join(f"{site} {count:,}" for site, count in counts.items())
+    print(f"통합 리뷰 {len(table):,}개 ({summary}) - {elapsed:.2f}s")
+    print(f"저장: {output_path}")
@@ -0,0 +1,286 @@
+# src/analysis/search.py
+"""
+리뷰 본문 전문 검색 인덱스 (SQLite).
+
+한국어는 띄어쓰기가 일정하지 않아 단어 단위 토큰화가 잘 맞지 않으므로, 본문에서 공백과
+기호를 뺀 뒤 문자 bigram(과 한 글자 검색용 unigram)을 색인어로 씁니다.
+postings(term, doc_id, tf) 역색인과 terms(term, df) 통계로 BM25 점수를 SQL 안에서 계산합니다.
+
+처리한 스냅샷 파일은 같은 DB의 files 테이블에 남겨, 다음 실행에서는 새로 생기거나
+바뀐 파일의 처음 보는 리뷰만 색인합니다.
+"""
+import math
+import os
+import sqlite3
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.analysis.normalize import SOURCE_FIELDS, changed_snapshot_files, compact_text, load_snapshot_files, normalize_frame
+from src.core.config import SEARCH_DB_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    doc_id      INTEGER PRIMARY KEY,
+    site        TEXT    NOT NULL,
+    review_id   INTEGER NOT NULL,
+    product_id  TEXT    NOT NULL,
+    created_at  TEXT,
+    score       INTEGER,
+    length      INTEGER NOT NULL,
+    body        TEXT,
+    UNIQUE (site, review_id)
+);
+CREATE INDEX IF NOT EXISTS idx_docs_product ON docs (product_id);
+CREATE TABLE IF NOT EXISTS postings (
+    term    TEXT    NOT NULL,
+    doc_id  INTEGER NOT NULL,
+    tf      INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    term    TEXT PRIMARY KEY,
+    df      INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS files (
+    path    TEXT PRIMARY KEY,
+    mtime   REAL NOT NULL,
+    size    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stats (
+    key     TEXT PRIMARY KEY,
+    value   REAL NOT NULL
+);
+"""
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+
+def document_terms(text: Optional[str]) -> Counter:
+    """문서 색인어 (unigram + bigram) 빈도"""
+    normalized = compact_text(text)
+    terms = Counter(normalized)
+    terms.update(normalized[i:i + 2] for i in range(len(normalized) - 1))
+    return terms
+
+
+def query_terms(query: str) -> List[str]:
+    """검색어 색인어. 한 글자 단어는 unigram, 그 외에는 bigram (모두 포함해야 일치)"""
+    terms = []
+    for word in query.split():
+        normalized = compact_text(word)
+        if len(normalized) == 1:
+            terms.append(normalized)
+        else:
+            terms.extend(normalized[i:i + 2] for i in range(len(normalized) - 1))
+    return list(dict.fromkeys(terms))
+
+
+class ReviewSearchIndex:
+    """리뷰 전문 검색 인덱스"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or SEARCH_DB_PATH
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def _stat(self, key: str) -> float:
+        row = self._conn.execute("SELECT value FROM stats WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else 0.0
+
+    @property
+    def doc_count(self) -> int:
+        return int(self._stat("doc_count"))
+
+    def _processed_files(self) -> Dict[str, list]:
+        return {row["path"]: [row["mtime"], row["size"]] for row in self._conn.execute("SELECT * FROM files")}
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    def add(self, table: pd.DataFrame) -> int:
+        """통합 리뷰 테이블에서 처음 보는 리뷰를 색인하고 추가한 개수를 반환 (트랜잭션은 호출자가 커밋)"""
+        frame = table[table["review_id"].notna() & table["text"].notna()].drop_duplicates(["site", "review_id"])
+        created = frame["ts"].dt.strftime("%Y-%m-%dT%H:%M:%S%z")
+
+        added = 0
+        total_length = 0
+        document_frequency: Counter = Counter()
+        cursor = self._conn.cursor()
+        for row, created_at in zip(frame.itertuples(index=False), created):
+            terms = document_terms(row.text)
+            length = sum(terms.values())
+            cursor.execute(
+                "INSERT OR IGNORE INTO docs (site, review_id, product_id, created_at, score, length, body) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(row.site),
+                    int(row.review_id),
+                    str(row.product),
+                    None if pd.isna(created_at) else created_at,
+                    None if pd.isna(row.score) else int(row.score),
+                    length,
+                    row.text,
+                ),
+            )
+            if cursor.rowcount == 0:
+                continue  # 이미 색인된 리뷰
+            doc_id = cursor.lastrowid
+            cursor.executemany(
+                "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                ((term, doc_id, tf) for term, tf in terms.items()),
+            )
+            document_frequency.update(terms.keys())
+            total_length += length
+            added += 1
+
+        cursor.executemany(
+            "INSERT INTO terms (term, df) VALUES (?, ?) ON CONFLICT (term) DO UPDATE SET df = df + excluded.df",
+            document_frequency.items(),
+        )
+        for key, delta in (("doc_count", added), ("total_length", total_length)):
+            cursor.execute(
+                "INSERT INTO stats (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = value + excluded.value",
+                (key, delta),
+            )
+        return added
+
+    def update_from_snapshots(self, sites: Optional[List[str]] = None, raw_dir: Optional[str] = None) -> Dict[str, int]:
+        """새로 생기거나 바뀐 스냅샷의 리뷰를 색인 (파일 단위 기록과 같은 트랜잭션)"""
+        processed = self._processed_files()
+        added = {}
+        for site in sites or list(SOURCE_FIELDS):
+            files = changed_snapshot_files(site, processed, raw_dir)
+            added[site] = 0
+            if not files:
+                continue
+            with self._conn:
+                added[site] = self.add(normalize_frame(site, load_snapshot_files(site, files)))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, mtime, size) VALUES (?, ?, ?)",
+                    ((path, os.stat(path).st_mtime, os.stat(path).st_size) for path in files),
+                )
+        return added
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        query: str,
+        site: Optional[str] = None,
+        product_id: Optional[str] = None,
+        min_score: Optional[int] = None,
+        max_score: Optional[int] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[sqlite3.Row]:
+        """BM25 순으로 검색어의 모든 색인어를 포함한 리뷰를 반환합니다."""
+        terms = query_terms(query)
+        if not terms:
+            return []
+
+        doc_count = self.doc_count
+        if not doc_count:
+            return []
+        average_length = self._stat("total_length") / doc_count
+
+        placeholders = ",".join("?" * len(terms))
+        frequencies = {
+            row["term"]: row["df"]
+            for row in self._conn.execute(f"SELECT term, df FROM terms WHERE term IN ({placeholders})", terms)
+        }
+        if len(frequencies) < len(terms):
+            return []  # 한 번도 나오지 않은 색인어가 있으면 일치하는 문서가 없음
+
+        # 희귀한 색인어부터 조인하도록 df 오름차순
+        terms.sort(key=frequencies.get)
+        weights = []
+        for term in terms:
+            df = frequencies[term]
+            weights.extend([term, _idf(doc_count, df)])
+
+        conditions, params = [], []
+        for column, operator, value in (
+            ("d.site", "=", site),
+            ("d.product_id", "=", product_id),
+            ("d.score", ">=", min_score),
+            ("d.score", "<=", max_score),
+            ("d.created_at", ">=", since),
+            ("d.created_at", "<", until),
+        ):
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        sql = f"""
+            WITH q (term, idf) AS (VALUES {",".join("(?, ?)" for _ in terms)}),
+                 bm25 (k1, b, avgdl) AS (VALUES (?, ?, ?))
+            SELECT d.site, d.review_id, d.product_id, d.created_at, d.score, d.body,
+                   SUM(q.idf * p.tf * (bm25.k1 + 1) / (p.tf + bm25.k1 * (1 - bm25.b + bm25.b * d.length / bm25.avgdl))) AS rank
+            FROM q
+            CROSS JOIN bm25
+            JOIN postings p ON p.term = q.term
+            JOIN docs d ON d.doc_id = p.doc_id
+            {where}
+            GROUP BY d.doc_id
+            HAVING COUNT(*) = ?
+            ORDER BY rank DESC
+            LIMIT ?
+        """
+        return self._conn.execute(sql, [*weights, K1, B, average_length, *params, len(terms), limit]).fetchall()
+
+
+def _idf(doc_count: float, df: int) -> float:
+    return math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+
+def run_search_cli(args):
+    """main.py search 처리: 인덱스를 증분 갱신하고 --text 검색 결과를 출력"""
+    index = ReviewSearchIndex(args.db)
+
+    started = time.perf_counter()
+    added = index.update_from_snapshots([args.site] if args.site else None)
+    if any(added.values()):
+        for site, count in added.items():
+            print(f"[{site}] 새 리뷰 {count:,}개 색인")
+        print(f"색인 갱신: {time.perf_counter() - started:.2f}s")
+
+    if not args.text:
+        print(f"검색 인덱스: 리뷰 {index.doc_count:,}개 -> {index.path}")
+        index.close()
+        return
+
+    query_started = time.perf_counter()
+    rows = index.search(
+        args.text,
+        site=args.site,
+        product_id=args.product,
+        min_score=args.min_score,
+        max_score=args.max_score,
+        since=args.since,
+        until=args.until,
+        limit=args.limit,
+    )
+    elapsed_ms = (time.perf_counter() - query_started) * 1000
+    for row in rows:
+        body = (row["body"] or "").replace("\n", " ")
+        print(
+            f"[{row['site']}] {row['product_id']} #{row['review_id']} "
+            f"{(row['created_at'] or '')[:10]} ★{row['score']}  {row['rank']:.2f}  {body[:80]}"
+        )
+    print(f"\n{len(rows)}건 ({elapsed_ms:.1f}ms)")
+    index.close()
@@ -0,0 +1,239 @@
+# src/analysis/tokens.py
+"""
+리뷰 본문 토큰화 + 상품별 키워드 빈도 파이프라인.
+
+새로 생기거나 바뀐 스냅샷에서 아직 처리하지 않은 리뷰만 골라 청크 단위로 프로세스 풀에
+나눠 토큰화합니다. kiwipiepy가 설치되어 있으면 형태소 분석(명사 · 동사 · 형용사 어간)을,
+없으면 정규식 + 조사 제거 규칙을 사용합니다.
+
+- data/analysis/tokens/part-*.parquet: 리뷰별 토큰 배열 (site, product, review_id, tokens), 실행마다 파일 추가
+- data/analysis/keywords.parquet: 상품별 키워드 빈도 (site, product, token, count, reviews), 더하기로 갱신
+- data/state/analysis/tokens/: 처리한 스냅샷 파일 목록과 리뷰 ID 인덱스
+"""
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.analysis.normalize import (
+    SOURCE_FIELDS,
+    changed_snapshot_files,
+    load_snapshot_files,
+    mark_processed,
+    normalize_frame,
+)
+from src.core.config import DATA_ANALYSIS_DIR
+from src.core.id_index import ReviewIdIndex
+from src.core.state import load_state, save_state, state_path
+
+CHUNK_SIZE = 1000
+KEYWORD_KEYS = ["site", "product", "token"]
+
+# kiwipiepy 품사 중 키워드로 쓰는 것 (일반/고유 명사, 동사/형용사 어간, 어근, 외국어)
+KIWI_TAGS = {"NNG", "NNP", "VV", "VA", "XR", "SL"}
+
+# 정규식 토큰화에서 떼어 낼 조사 · 어미 (긴 것부터 검사)
+_SUFFIXES = sorted(
+    [
+        "에서는", "으로는", "에서", "으로", "에게", "한테", "까지", "부터", "처럼", "보다", "이라", "이랑",
+        "하고", "해서", "했는데", "했어요", "해요", "합니다", "입니다", "이에요", "예요", "네요", "어요", "아요",
+        "은", "는", "이", "가", "을", "를", "에", "도", "의", "로", "과", "와", "만", "랑", "요",
+    ],
+    key=len,
+    reverse=True,
+)
+_WORD = re.compile(r"[가-힣]+|[a-zA-Z]+")
+_REPEATED = re.compile(r"(.)\1{2,}")
+
+STOPWORDS = {
+    "너무", "정말", "진짜", "그냥", "항상", "계속", "이번", "조금", "많이", "아주", "매우", "역시",
+    "제품", "구매", "사용", "있어", "있는", "같아", "같은", "하는", "그리고", "근데", "the", "and",
+    "하다", "되다", "있다", "없다", "같다", "않다",  # kiwipiepy 기본형
+}
+
+_kiwi = None
+
+
+def _init_worker(use_kiwi: bool):
+    """프로세스 풀 워커 초기화: kiwipiepy 모델은 프로세스마다 한 번만 로드"""
+    global _kiwi
+    if use_kiwi:
+        from kiwipiepy import Kiwi
+
+        _kiwi = Kiwi()
+
+
+def kiwi_available() -> bool:
+    try:
+        import kiwipiepy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _strip_suffix(word: str) -> str:
+    for suffix in _SUFFIXES:
+        if len(word) > len(suffix) + 1 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """본문 하나를 정규화된 토큰 목록으로 변환"""
+    if not text:
+        return []
+    text = _REPEATED.sub(r"\1\1", text)  # "좋아요오오오" -> "좋아요오오"
+
+    if _kiwi is not None:
+        tokens = [
+            token.form.lower() + ("다" if token.tag in ("VV", "VA") else "")
+            for token in _kiwi.tokenize(text)
+            if token.tag in KIWI_TAGS
+        ]
+    else:
+        tokens = [_strip_suffix(word.lower()) for word in _WORD.findall(text)]
+
+    return [token for token in tokens if len(token) >= 2 and token not in STOPWORDS]
+
+
+def tokenize_chunk(texts: List[Optional[str]]) -> List[List[str]]:
+    return [tokenize(text) for text in texts]
+
+
+def count_keywords(frame: pd.DataFrame) -> pd.DataFrame:
+    """리뷰별 토큰에서 (site, product, token) 단위 등장 횟수와 등장 리뷰 수를 집계"""
+    exploded = frame[["site", "product", "review_id", "tokens"]].explode("tokens").dropna(subset=["tokens"])
+    if exploded.empty:
+        return pd.DataFrame(columns=KEYWORD_KEYS + ["count", "reviews"])
+    exploded = exploded.rename(columns={"tokens": "token"})
+    return exploded.groupby(KEYWORD_KEYS, as_index=False).agg(
+        count=("review_id", "size"),
+        reviews=("review_id", "nunique"),
+    )
+
+
+class TokenPipeline:
+    """
+    증분 토큰화 파이프라인.
+    """
+
+    def __init__(self, workers: Optional[int] = None, raw_dir: Optional[str] = None, output_dir: Optional[str] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.raw_dir = raw_dir
+        self.output_dir = output_dir or DATA_ANALYSIS_DIR
+        self.tokens_dir = os.path.join(self.output_dir, "tokens")
+        self.keywords_path = os.path.join(self.output_dir, "keywords.parquet")
+        self.files_state_path = state_path("analysis", os.path.join("tokens", "processed_files.json"))
+        self.use_kiwi = kiwi_available()
+
+    def _id_index(self, site: str) -> ReviewIdIndex:
+        return ReviewIdIndex(state_path("analysis", os.path.join("tokens", f"{site}.ids")))
+
+    def _pending_reviews(self, sites: List[str], processed: Dict[str, list]) -> Tuple[pd.DataFrame, Dict[str, List[str]]]:
+        """아직 토큰화하지 않은 리뷰와, 그 리뷰를 읽은 스냅샷 파일 목록"""
+        frames, files_by_site = [], {}
+        for site in sites:
+            files = changed_snapshot_files(site, processed, self.raw_dir)
+            files_by_site[site] = files
+            if not files:
+                continue
+            table = normalize_frame(site, load_snapshot_files(site, files))
+            table = table[table["review_id"].notna()].drop_duplicates("review_id")
+            table = table[~table["review_id"].isin(self._id_index(site).load())]
+            frames.append(table[["site", "product", "review_id", "text"]])
+        pending = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["site", "product", "review_id", "text"])
+        return pending, files_by_site
+
+    def _tokenize(self, texts: List[Optional[str]]) -> List[List[str]]:
+        chunks = [texts[i:i + CHUNK_SIZE] for i in range(0, len(texts), CHUNK_SIZE)]
+        if self.workers <= 1 or len(chunks) <= 1:
+            _init_worker(self.use_kiwi)
+            return [tokens for chunk in chunks for tokens in tokenize_chunk(chunk)]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(self.use_kiwi,),
+        ) as executor:
+            return [tokens for result in executor.map(tokenize_chunk, chunks) for tokens in result]
+
+    def _merge_keywords(self, delta: pd.DataFrame) -> pd.DataFrame:
+        if os.path.exists(self.keywords_path):
+            current = pd.read_parquet(self.keywords_path)
+            delta = pd.concat([current, delta], ignore_index=True)
+            delta = delta.groupby(KEYWORD_KEYS, as_index=False)[["count", "reviews"]].sum()
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = self.keywords_path + ".tmp"
+        delta.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self.keywords_path)
+        return delta
+
+    def run(self, sites: Optional[List[str]] = None) -> Dict[str, int]:
+        """처리하지 않은 리뷰만 토큰화하고 사이트별 처리 개수를 반환"""
+        sites = sites or list(SOURCE_FIELDS)
+        if not os.path.exists(self.keywords_path):
+            # 결과 파일이 없으면 처음부터 다시 처리 (keywords.parquet 과 tokens/ 는 모든 사이트 공용)
+            for site in SOURCE_FIELDS:
+                index = self._id_index(site)
+                if index.exists():
+                    os.remove(index.path)
+            if os.path.isdir(self.tokens_dir):
+                shutil.rmtree(self.tokens_dir)
+            save_state(self.files_state_path, {})
+
+        processed = load_state(self.files_state_path, {}) or {}
+        pending, files_by_site = self._pending_reviews(sites, processed)
+
+        if not pending.empty:
+            pending["tokens"] = self._tokenize(pending["text"].tolist())
+            pending["review_id"] = pending["review_id"].astype("int64")
+            pending["site"] = pending["site"].astype(str)
+
+            os.makedirs(self.tokens_dir, exist_ok=True)
+            part_path = os.path.join(self.tokens_dir, f"part-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.parquet")
+            pending[["site", "product", "review_id", "tokens"]].to_parquet(part_path, index=False)
+            self._merge_keywords(count_keywords(pending))
+
+            for site, ids in pending.groupby("site")["review_id"]:
+                self._id_index(site).add(ids.tolist())
+
+        for site, files in files_by_site.items():
+            mark_processed(processed, files)
+        save_state(self.files_state_path, processed)
+        return pending.groupby("site").size().to_dict() if not pending.empty else {}
+
+
+def load_tokens(output_dir: Optional[str] = None) -> pd.DataFrame:
+    """리뷰별 토큰 전체 (part 파일 합본)"""
+    tokens_dir = os.path.join(output_dir or DATA_ANALYSIS_DIR, "tokens")
+    if not os.path.isdir(tokens_dir):
+        return pd.DataFrame(columns=["site", "product", "review_id", "tokens"])
+    return pd.read_parquet(tokens_dir)
+
+
+def run_tokenize_cli(sites: Optional[List[str]] = None, workers: Optional[int] = None, limit: int = 20):
+    """main.py tokenize 처리"""
+    pipeline = TokenPipeline(workers=workers)
+    print(f"토크나이저: {'kiwipiepy' if pipeline.use_kiwi else '정규식 (pip install kiwipiepy 로 형태소 분석 사용)'} · 프로세스 {pipeline.workers}개")
+
+    started = time.perf_counter()
+    counts = pipeline.run(sites)
+    elapsed = time.perf_counter() - started
+    for site, count in counts.items():
+        print(f"[{site}] 리뷰 {count:,}개 토큰화")
+    print(f"완료: {elapsed:.2f}s")
+
+    if not os.path.exists(pipeline.keywords_path):
+        return
+    keywords = pd.read_parquet(pipeline.keywords_path)
+    if sites:
+        keywords = keywords[keywords["site"].isin(sites)]
+    top = keywords.groupby("token")["reviews"].sum().nlargest(limit)
+    print("\n상위 키워드 (등장 리뷰 수)")
+    print("  " + ", ".join(f"{token} {count:,}" for token, count in top.items()))
+    print(f"저장: {pipeline.keywords_path}, {pipeline.tokens_dir}/")
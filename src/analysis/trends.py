@@ -0,0 +1,251 @@
+# src/analysis/trends.py
+"""
+상품별 · 일별 리뷰 집계를 증분으로 유지하고 추이 차트를 다시 그립니다.
+
+집계 테이블(data/analysis/daily_aggregates.parquet)의 한 행은 (site, product, day)이고
+리뷰 수, 점수 합계, 점수별 개수(score_1..score_5), 포토 리뷰 수를 담습니다.
+평균 점수와 포토 리뷰 비율은 읽을 때 합계에서 계산하므로 새 리뷰는 더하기만 하면 됩니다.
+
+이미 반영한 스냅샷 파일(mtime/size)과 리뷰 ID는 data/state/analysis/ 에 남겨,
+다음 실행에서는 새로 생기거나 바뀐 파일의 새 리뷰만 집계에 더합니다.
+"""
+import os
+import time
+import warnings
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from src.analysis.normalize import (
+    SOURCE_FIELDS,
+    changed_snapshot_files,
+    load_snapshot_files,
+    mark_processed,
+    normalize_frame,
+)
+from src.core.config import DATA_ANALYSIS_DIR
+from src.core.id_index import ReviewIdIndex
+from src.core.state import load_state, save_state, state_path
+
+AGGREGATE_KEYS = ["site", "product", "day"]
+SCORE_COLUMNS = [f"score_{score}" for score in range(1, 6)]
+AGGREGATE_COLUMNS = AGGREGATE_KEYS + ["count", "score_sum"] + SCORE_COLUMNS + ["photo_count"]
+
+SITE_TITLES = {
+    "apmall": "아모레몰",
+    "naver": "네이버 스마트스토어",
+}
+
+# 차트 한글 표시용 폰트 후보 (설치된 것 중 첫 번째 사용)
+KOREAN_FONTS = ["AppleGothic", "Malgun Gothic", "NanumGothic", "Noto Sans CJK KR", "Noto Sans KR"]
+
+
+def aggregate_path(output_dir: Optional[str] = None) -> str:
+    return os.path.join(output_dir or DATA_ANALYSIS_DIR, "daily_aggregates.parquet")
+
+
+def aggregate_reviews(table: pd.DataFrame) -> pd.DataFrame:
+    """통합 리뷰 테이블을 (site, product, day) 단위 합계로 집계"""
+    if table.empty:
+        return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+
+    frame = pd.DataFrame(
+        {
+            "site": table["site"].astype(str),
+            "product": table["product"].astype(str),
+            # 일 단위 집계는 한국 시간 기준
+            "day": table["ts"].dt.tz_convert("Asia/Seoul").dt.strftime("%Y-%m-%d"),
+            "count": 1,
+            "score_sum": table["score"].fillna(0).astype("int64"),
+            "photo_count": table["has_photo"].astype("int64"),
+        }
+    )
+    for score, column in zip(range(1, 6), SCORE_COLUMNS):
+        frame[column] = table["score"].eq(score).fillna(False).astype("int64")
+
+    frame = frame.dropna(subset=["day"])
+    return frame.groupby(AGGREGATE_KEYS, as_index=False)[AGGREGATE_COLUMNS[3:]].sum()
+
+
+def merge_aggregates(current: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """기존 집계에 새 리뷰 집계를 더합니다."""
+    if current.empty:
+        return delta.reset_index(drop=True)
+    if delta.empty:
+        return current
+    merged = pd.concat([current, delta], ignore_index=True)
+    return merged.groupby(AGGREGATE_KEYS, as_index=False)[AGGREGATE_COLUMNS[3:]].sum()
+
+
+def with_derived_columns(aggregates: pd.DataFrame) -> pd.DataFrame:
+    """합계 컬럼에서 평균 점수와 포토 리뷰 비율을 계산해 붙입니다."""
+    frame = aggregates.copy()
+    frame["mean_score"] = frame["score_sum"] / frame["count"]
+    frame["photo_share"] = frame["photo_count"] / frame["count"]
+    return frame
+
+
+def load_aggregates(output_dir: Optional[str] = None) -> pd.DataFrame:
+    path = aggregate_path(output_dir)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+    return pd.read_parquet(path)
+
+
+class TrendAnalyzer:
+    """
+    스냅샷 파일 → 일별 집계 증분 갱신 → 추이 차트 렌더링.
+    """
+
+    def __init__(self, raw_dir: Optional[str] = None, output_dir: Optional[str] = None):
+        self.raw_dir = raw_dir
+        self.output_dir = output_dir or DATA_ANALYSIS_DIR
+        self.files_state_path = state_path("analysis", "processed_files.json")
+
+    def _id_index(self, site: str) -> ReviewIdIndex:
+        return ReviewIdIndex(state_path("analysis", f"{site}.ids"))
+
+    def _reset_state(self):
+        """집계 파일이 없으면 상태도 처음부터 다시 만듭니다 (집계 · 파일 상태는 모든 사이트 공용)."""
+        for site in SOURCE_FIELDS:
+            index = self._id_index(site)
+            if index.exists():
+                os.remove(index.path)
+        save_state(self.files_state_path, {})
+
+    def update(self, sites: Optional[List[str]] = None) -> Dict[str, int]:
+        """새로 생기거나 바뀐 스냅샷의 새 리뷰만 집계에 더합니다. 사이트별 추가 리뷰 수를 반환."""
+        sites = sites or list(SOURCE_FIELDS)
+        if not os.path.exists(aggregate_path(self.output_dir)):
+            self._reset_state()
+
+        processed = load_state(self.files_state_path, {}) or {}
+        aggregates = load_aggregates(self.output_dir)
+        added = {}
+        new_ids = {}
+
+        for site in sites:
+            files = changed_snapshot_files(site, processed, self.raw_dir)
+            added[site] = 0
+            if not files:
+                continue
+
+            table = normalize_frame(site, load_snapshot_files(site, files))
+            index = self._id_index(site)
+            seen = index.load()
+            # 같은 리뷰가 여러 스냅샷에 있으므로 처음 보는 ID만 집계
+            table = table[table["review_id"].notna()]
+            table = table.drop_duplicates("review_id")
+            table = table[~table["review_id"].isin(seen)]
+
+            aggregates = merge_aggregates(aggregates, aggregate_reviews(table))
+            new_ids[site] = table["review_id"].astype("int64").tolist()
+            added[site] = len(table)
+            mark_processed(processed, files)
+
+        if any(added.values()) or not os.path.exists(aggregate_path(self.output_dir)):
+            os.makedirs(self.output_dir, exist_ok=True)
+            tmp_path = aggregate_path(self.output_dir) + ".tmp"
+            aggregates.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, aggregate_path(self.output_dir))
+        for site, ids in new_ids.items():
+            self._id_index(site).add(ids)
+        save_state(self.files_state_path, processed)
+        return added
+
+    def render(self, sites: Optional[List[str]] = None) -> List[str]:
+        """집계 테이블에서 사이트별 추이 차트(SVG)를 다시 그립니다."""
+        try:
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+            from matplotlib import font_manager
+        except ImportError:
+            print("⚠️  matplotlib이 설치되어 있지 않아 차트를 건너뜁니다. (pip install matplotlib)")
+            return []
+
+        available = {font.name for font in font_manager.fontManager.ttflist}
+        korean = [name for name in KOREAN_FONTS if name in available]
+        if korean:
+            plt.rcParams["font.family"] = korean[0]
+        else:
+            print("⚠️  한글 폰트를 찾지 못해 차트의 한글이 깨질 수 있습니다.")
+            warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+        plt.rcParams["axes.unicode_minus"] = False
+
+        aggregates = load_aggregates(self.output_dir)
+        written = []
+        for site in sites or list(SOURCE_FIELDS):
+            site_rows = aggregates[aggregates["site"] == site]
+            if site_rows.empty:
+                continue
+
+            daily = site_rows.groupby("day")[AGGREGATE_COLUMNS[3:]].sum()
+            daily.index = pd.to_datetime(daily.index)
+            daily = with_derived_columns(daily)
+            monthly = daily["count"].resample("MS").sum()
+
+            # 최근 1년은 일별 추이 (30일 이동 평균)
+            recent = daily[daily.index >= daily.index.max() - pd.Timedelta(days=365)]
+            recent = recent.asfreq("D", fill_value=0)
+            rolling = recent[["count", "score_sum", "photo_count"]].rolling(30, min_periods=1).sum()
+            rolling_count = rolling["count"].where(rolling["count"] > 0)
+
+            fig, (ax_month, ax_day) = plt.subplots(2, 1, figsize=(16, 12))
+            title = SITE_TITLES.get(site, site)
+
+            ax_month.bar(monthly.index, monthly.values, width=20, color="#355f8d")
+            ax_month.set_title(f"{title} 월별 리뷰 수")
+            ax_month.set_xlabel("월")
+            ax_month.set_ylabel("리뷰 수")
+            ax_month.yaxis.set_major_formatter(matplotlib.ticker.StrMethodFormatter("{x:,.0f}"))
+
+            ax_day.plot(recent.index, recent["count"], color="#355f8d", linewidth=1, label="일별 리뷰 수")
+            ax_day.set_ylabel("리뷰 수")
+            ax_score = ax_day.twinx()
+            ax_score.plot(recent.index, rolling["score_sum"] / rolling_count, color="#e07b39", label="평균 점수 (30일)")
+            ax_score.plot(
+                recent.index,
+                rolling["photo_count"] / rolling_count * 5,
+                color="#3b9c5a",
+                linestyle="--",
+                label="포토 리뷰 비율 (30일, ×5)",
+            )
+            ax_score.set_ylim(0, 5.2)
+            ax_score.set_ylabel("평균 점수")
+            ax_day.set_title(f"{title} 최근 1년 일별 추이")
+            lines = ax_day.get_legend_handles_labels()
+            score_lines = ax_score.get_legend_handles_labels()
+            ax_day.legend(lines[0] + score_lines[0], lines[1] + score_lines[1], loc="upper left")
+
+            fig.tight_layout()
+            path = os.path.join(self.output_dir, f"{site}_review_trend.svg")
+            fig.savefig(path)
+            plt.close(fig)
+            written.append(path)
+        return written
+
+
+def run_analyze_cli(sites: Optional[List[str]] = None, raw_dir: Optional[str] = None):
+    """main.py analyze 처리: 집계를 증분 갱신하고 차트를 다시 그립니다."""
+    analyzer = TrendAnalyzer(raw_dir)
+
+    started = time.perf_counter()
+    added = analyzer.update(sites)
+    updated_at = time.perf_counter()
+    for site, count in added.items():
+        print(f"[{site}] 새 리뷰 {count:,}개 집계")
+    print(f"집계 갱신: {updated_at - started:.2f}s -> {aggregate_path(analyzer.output_dir)}")
+
+    # 새 리뷰가 없고 차트가 이미 있으면 다시 그리지 않음
+    render_sites = [
+        site
+        for site in sites or list(SOURCE_FIELDS)
+        if added.get(site) or not os.path.exists(os.path.join(analyzer.output_dir, f"{site}_review_trend.svg"))
+    ]
+    charts = analyzer.render(render_sites) if render_sites else []
+    for path in charts:
+        print(f"차트: {path}")
+    if charts:
+        print(f"차트 렌더링: {time.perf_counter() - updated_at:.2f}s")
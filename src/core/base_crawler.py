@@ -1,38 +1,180 @@
 from abc import ABC, abstractmethod
 import os
 import json
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Tuple
+
+from src.core.config import DATA_RAW_DIR, OUTPUT_FORMAT, OUTPUT_COMPRESSION, VALIDATE_REVIEWS
+from src.core.job_queue import LeaseHeartbeat
+from src.core.validation import create_validator
+from src.core.writers import ReviewWriter, output_filename
+
+class RunStats:
+    """실행 단위 트래픽/수집 카운터 (워커 스레드 간 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.reviews = 0
+
+    def record_request(self, nbytes: int = 0, ok: bool = True):
+        with self._lock:
+            self.requests += 1
+            self.bytes += nbytes
+            if not ok:
+                self.errors += 1
+
+    def add_reviews(self, count: int):
+        with self._lock:
+            self.reviews += count
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "reviews": self.reviews,
+                "requests": self.requests,
+                "errors": self.errors,
+                "bytes": self.bytes,
+                "duration_seconds": round(time.time() - self.started_at, 1),
+            }
 
-from src.core.config import DATA_RAW_DIR
 
 class BaseCrawler(ABC):
     def __init__(self, site_name: str):
         self.site_name = site_name
+        # JSON 외 추가 저장소 (src.core.review_store 의 ReviewSink)
+        self.sinks: List[Any] = []
+        # 스트리밍 출력 형식/압축
+        self.output_format = OUTPUT_FORMAT
+        self.output_compression = OUTPUT_COMPRESSION
+        # API 페이지 검증기 (src.core.validation)
+        self.validator = create_validator(self.site_name) if VALIDATE_REVIEWS else None
         self.base_output_dir = os.path.join(DATA_RAW_DIR, self.site_name)
         self.timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         self.current_output_dir = os.path.join(self.base_output_dir, self.timestamp)
+        # 실행 메타데이터 (사용한 설정값, 프로브 결과 등)
+        self.run_meta: Dict[str, Any] = {"site": self.site_name, "timestamp": self.timestamp}
+        # 요청 수 / 바이트 / 수집 리뷰 수 (main.py --site all 요약에 사용)
+        self.run_stats = RunStats()
+        # 여러 프로세스/호스트가 나눠 크롤링할 때의 공유 작업 큐 (src.core.job_queue, main.py --queue)
+        self.job_queue = None
+        # 적응형 요청 속도 컨트롤러 (src.core.pacing.AdaptivePacingController), 사이트 크롤러가 설정
+        self.pacing = None
 
     def _ensure_directory(self):
         """출력 디렉토리가 존재하는지 확인하고 생성합니다."""
         os.makedirs(self.current_output_dir, exist_ok=True)
 
-    def save_json(self, data: List[Dict[str, Any]], filename: str):
-        """데이터를 JSON 파일로 저장합니다."""
+    def open_writer(self, basename: str) -> ReviewWriter:
+        """
+        출력 디렉토리에 스트리밍 writer를 엽니다. 크롤러는 페이지가 도착할 때마다
+        write()로 넘기고, 끝나면 close()로 최종 파일명으로 확정합니다.
+        """
+        self._ensure_directory()
+        filename = output_filename(basename, self.output_format, self.output_compression)
+        file_path = os.path.join(self.current_output_dir, filename)
+        return ReviewWriter(file_path, self.output_format, self.output_compression)
+
+    def validate_page(self, records: List[Dict[str, Any]]):
+        """API 페이지 하나를 스키마로 검증합니다 (실패는 필드별로 집계)."""
+        if self.validator is None or not records:
+            return
+        try:
+            self.validator.validate_page(records)
+        except Exception as e:
+            print(f"[{self.site_name}] Validation error: {e}")
+
+    def report_validation(self):
+        """검증 결과를 출력하고 run_meta에 기록합니다."""
+        if self.validator is None or not self.validator.checked:
+            return
+        print(self.validator.report())
+        self.run_meta["validation"] = self.validator.summary()
+
+    def add_sink(self, sink):
+        """리뷰 저장소(sink)를 등록합니다."""
+        self.sinks.append(sink)
+
+    def emit_reviews(self, product_id: str, reviews: List[Dict[str, Any]]):
+        """수집한 리뷰를 등록된 모든 sink에 전달합니다."""
+        self.run_stats.add_reviews(len(reviews))
+        for sink in self.sinks:
+            try:
+                sink.write(self.site_name, product_id, reviews)
+            except Exception as e:
+                print(f"[{self.site_name}] Error writing to {sink.name} store: {e}")
+
+    def flush_sinks(self, product_id: str):
+        """상품 하나의 수집이 끝났음을 sink에 알립니다."""
+        for sink in self.sinks:
+            try:
+                sink.flush(self.site_name, product_id)
+            except Exception as e:
+                print(f"[{self.site_name}] Error flushing {sink.name} store: {e}")
+
+    def close_sinks(self):
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                print(f"[{self.site_name}] Error closing {sink.name} store: {e}")
+
+    def seed_jobs(self, jobs: List[Tuple[str, str]]):
+        """타겟 (상품 ID, URL) 목록을 작업 큐에 넣습니다. 이미 있는 작업은 그대로 둡니다."""
+        inserted = self.job_queue.seed(self.site_name, jobs)
+        counts = self.job_queue.counts(self.site_name).get(self.site_name, {})
+        print(
+            f"[{self.site_name}] 작업 큐 '{self.job_queue.name}': 새 작업 {inserted}개 · "
+            + ", ".join(f"{state} {count}" for state, count in sorted(counts.items()))
+        )
+        self.run_meta["job_queue"] = {"name": self.job_queue.name, "path": self.job_queue.path}
+
+    def run_job(self, job, crawl: Callable[[], Any]) -> bool:
+        """
+        작업 큐에서 가져온 상품 하나를 리스 하트비트와 함께 크롤링하고 결과를 큐에 보고합니다.
+        crawl()이 예외를 내거나 False를 반환하면 실패로 보고해 다시 대기 상태로 돌립니다.
+        """
+        with LeaseHeartbeat(self.job_queue, job):
+            try:
+                result = crawl()
+            except Exception as e:
+                self.job_queue.fail(job, f"{type(e).__name__}: {e}")
+                print(f"[{self.site_name}] ⚠️  작업 실패 ({job.key}, {job.attempts}회째): {e}")
+                return False
+            except BaseException:
+                self.job_queue.release(job)
+                raise
+
+        if result is False:
+            self.job_queue.fail(job, "incomplete")
+            print(f"[{self.site_name}] ⚠️  작업 미완료 ({job.key}, {job.attempts}회째), 다시 대기열로")
+            return False
+
+        report = {"output_dir": self.current_output_dir}
+        if isinstance(result, int) and not isinstance(result, bool):
+            report["reviews"] = result
+        if not self.job_queue.complete(job, report):
+            print(f"[{self.site_name}] ⚠️  작업 완료 보고 실패 ({job.key}): 리스가 만료되어 다른 워커가 가져갔습니다")
+        return True
+
+    def save_run_meta(self, filename: str = "run_meta.json"):
+        """실행 메타데이터(run_meta)를 출력 디렉토리에 저장합니다."""
+        self.run_meta["stats"] = self.run_stats.summary()
+        if self.pacing is not None and hasattr(self.pacing, "snapshot"):
+            self.run_meta["rate_control"] = self.pacing.snapshot()
         self._ensure_directory()
-        
-        # 파일명에 .json이 없으면 추가
-        if not filename.endswith('.json'):
-            filename += '.json'
-            
         file_path = os.path.join(self.current_output_dir, filename)
-        
+
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"[{self.site_name}] Saved {len(data)} records to {file_path}")
+                json.dump(self.run_meta, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            print(f"[{self.site_name}] Error saving file {filename}: {e}")
+            print(f"[{self.site_name}] Error saving run metadata: {e}")
 
     @abstractmethod
     def run(self):
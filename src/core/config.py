@@ -5,6 +5,46 @@
 # ============================================================
 INPUT_FILE = "data/input/targets.xlsx"
 DATA_RAW_DIR = "data/raw"
+DATA_STATE_DIR = "data/state"  # 증분 크롤링 상태 (워터마크, 체크포인트 등)
+DATA_WAREHOUSE_DIR = "data/warehouse"  # 컬럼형/DB 리뷰 저장소 (main.py --store)
+PARQUET_FLUSH_ROWS = 50_000  # Parquet sink: 상품 하나의 버퍼가 이 행 수를 넘으면 part 파일로 먼저 기록
+REVIEW_DB_PATH = "data/warehouse/reviews.db"  # SQLite 리뷰 DB (--store sqlite, main.py query)
+SEARCH_DB_PATH = "data/warehouse/search.db"  # 리뷰 전문 검색 인덱스 (main.py search)
+DATA_ANALYSIS_DIR = "data/analysis"  # 분석 결과 (집계 테이블, 추이 차트)
+DATA_LOGS_DIR = "data/logs"  # 사이트별 실행 로그 (main.py --site all)
+
+# 여러 프로세스/호스트가 같은 타겟 목록을 나눠 크롤링하는 작업 큐 (main.py --queue)
+JOB_QUEUE_PATH = "data/state/jobs.db"  # 모든 호스트가 보는 공유 디렉토리에 두면 함께 사용 (main.py --queue-db)
+JOB_LEASE_SECONDS = 600  # 하트비트 없이 이 시간이 지나면 다른 워커가 작업을 가져감
+JOB_MAX_ATTEMPTS = 3  # 실패한 작업을 다시 시도하는 최대 횟수
+
+# 리뷰 출력 파일 형식 (main.py --format / --compress)
+OUTPUT_FORMAT = "json"  # "json" (배열) 또는 "ndjson" (한 줄에 리뷰 하나)
+OUTPUT_COMPRESSION = None  # None, "gzip", "zstd"
+
+# 수집한 API 페이지를 스키마(pydantic)로 검증할지 여부
+VALIDATE_REVIEWS = True
+
+# 적응형 요청 속도 조절 (AIMD, src.core.pacing.AdaptivePacingController)
+# 성공이 이어지면 조금씩 올리고, 응답 지연 증가 · 429/5xx · 차단 감지 시 배수로 낮춤
+RATE_CONTROL = {
+    "increase_step": 0.05,  # 성공 success_window 번마다 올리는 초당 요청 수
+    "success_window": 10,
+    "decrease_factor": 0.5,  # 429/5xx/연결 오류 · 차단 시 속도 배수
+    "latency_factor": 2.0,  # 응답 지연이 기준의 N배를 넘으면 감속
+    "latency_slack": 0.2,  # 기준보다 이 시간(초) 이상 늘었을 때만 (작은 흔들림 무시)
+    "latency_decrease_factor": 0.8,  # 지연 증가 시 속도 배수
+    "decrease_interval": 5.0,  # 감속 후 이 시간(초) 안의 신호는 한 번으로 취급
+    "cooldown_base": 30,  # 첫 차단 쿨다운 (초), 회복 없이 연속되면 두 배씩
+    "cooldown_max": 300,
+}
+
+# 리뷰 첨부 이미지 다운로드 (main.py download-images)
+DATA_IMAGES_DIR = "data/images"  # 내용 해시 기준 저장소 + manifest.jsonl
+IMAGE_CONCURRENCY = 8  # 동시에 받는 이미지 수 (main.py --workers)
+IMAGE_MAX_RPS = 10.0  # 이미지 호스트별 초당 요청 상한
+IMAGE_TIMEOUT = 30  # 이미지 요청 타임아웃 (초)
+IMAGE_MAX_SIZE = None  # 긴 변 최대 픽셀 (None = 원본 저장, Pillow 필요, main.py --max-size)
 
 # ============================================================
 # 아모레몰 (APMall) 설정
@@ -33,7 +73,7 @@ APMALL_API_URL = "https://api-gw.amoremall.com/commune/v2/M01/apcp/reviews"
 HEADERS = APMALL_HEADERS
 API_URL = APMALL_API_URL
 
-# 아모레몰 크롤링 딜레이 (초)
+# 아모레몰 크롤링 딜레이 (초) - 적응형 속도 조절의 시작 속도로 사용 (평균 딜레이의 역수)
 APMALL_MIN_DELAY = 1.0
 APMALL_MAX_DELAY = 3.0
 
@@ -41,20 +81,75 @@ APMALL_MAX_DELAY = 3.0
 MIN_DELAY = APMALL_MIN_DELAY
 MAX_DELAY = APMALL_MAX_DELAY
 
+# 아모레몰 동시 크롤링 설정
+APMALL_WORKERS = 1  # 동시에 크롤링할 상품 수 (main.py --workers 로 변경)
+APMALL_MAX_RPS = 2.0  # api-gw.amoremall.com 전체 초당 요청 상한 (모든 워커 공유, 적응형 속도의 최대값)
+APMALL_INITIAL_RPS = 2 / (APMALL_MIN_DELAY + APMALL_MAX_DELAY)  # 적응형 속도 시작값
+APMALL_MIN_RPS = 0.1  # 적응형 속도 최소값
+APMALL_OFFSET_WINDOW = 1  # 상품 하나 안에서 동시에 요청할 offset 수 (1 = 순차, main.py --window)
+APMALL_OFFSET_RETRIES = 3  # 실패한 offset 개별 재시도 횟수
+
+# 리뷰 API 페이지 크기 (limit)
+APMALL_DEFAULT_PAGE_SIZE = 10  # 프로브 실패 시 사용하는 기본값
+APMALL_PAGE_SIZE_CANDIDATES = [100, 50, 30, 20]  # 실행마다 큰 값부터 한 번씩 프로브
+
 # ============================================================
 # 네이버 스마트스토어 설정
 # ============================================================
 NAVER_CONFIG = {
     # 브라우저 설정
-    "headless": False,  # Headed 모드 (봇 감지 우회)
+    "headless": False,  # Headed 모드 (봇 감지 우회), main.py --headless 로 변경
     "channel": "chrome",  # 시스템 Chrome 사용
+    "headless_channel": None,  # headless 실행 시 채널 (None = Playwright 번들 Chromium)
     "viewport": {"width": 1600, "height": 900},
-    # 크롤링 딜레이 (초)
-    "page_delay_min": 0.8,  # 페이지 전환 최소 딜레이
-    "page_delay_max": 1.5,  # 페이지 전환 최대 딜레이
-    "product_delay": 5,  # 상품 간 딜레이
+    # 요청 속도 (초당 페이지, 모든 워커 공유): 응답 지연 · 429/5xx · 차단 감지에 따라
+    # 아래 범위 안에서 자동 조절 (RATE_CONTROL)
+    "initial_pages_per_second": 0.7,  # 시작 속도 (기존 0.8~1.5초 딜레이 수준)
+    "min_pages_per_second": 0.1,
+    "max_pages_per_second": 2.0,  # 상한
+    # 병렬 크롤링 (main.py --workers)
+    "workers": 1,  # 동시에 크롤링할 브라우저 수
     # 저장 설정
     "save_batch_size": 100,  # N개마다 디스크에 저장
+    "incremental_stop_pages": 3,  # 증분 모드: 기존 리뷰만 있는 페이지가 N번 연속이면 종료
+    "segment_compress": False,  # 배치 세그먼트 로그(JSONL) gzip 압축 여부
     # API 엔드포인트
     "review_api_pattern": "/contents/reviews/query-pages",
+    # 네트워크 리소스 필터 (src/sites/naver/resource_filter.py)
+    "resource_filter": {
+        "enabled": True,
+        # "cdp": 브라우저 차단 목록 (HTTP 캐시 유지) / "route": page.route (캐시 비활성, allow_patterns 적용)
+        # "auto": headless면 cdp, headed면 route (캡차를 직접 풀 수 있도록 allow_patterns 정확히 적용)
+        "mode": "auto",
+        "resource_types": ["image", "media", "font"],  # 차단할 리소스 타입
+        "type_url_patterns": {  # cdp 모드: 리소스 타입별 차단 URL 패턴
+            "image": ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.svg*", "*.ico*"],
+            "media": ["*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"],
+            "font": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*"],
+        },
+        "blocked_domains": [  # 광고/분석 비콘
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "facebook.net",
+            "criteo.com",
+            "wcs.naver.net",
+            "lcs.naver.com",
+            "nlog.naver.com",
+            "veta.naver.com",
+            "tivan.naver.com",
+        ],
+        "allow_patterns": [  # 항상 통과 (리뷰 위젯, 캡차), cdp 모드에서는 차단되면 그 페이지의 차단 해제
+            "/contents/reviews",
+            "captcha",
+        ],
+        # 차단 1건당 평균 크기 추정치 (바이트) - 절감량 집계용
+        "estimated_bytes": {
+            "image": 80_000,
+            "media": 500_000,
+            "font": 40_000,
+            "tracker": 2_000,
+        },
+    },
+    "direct_api": True,  # 세션을 재사용해 리뷰 API 직접 호출 (실패 시 버튼 클릭)
 }
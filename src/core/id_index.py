@@ -0,0 +1,61 @@
+# src/core/id_index.py
+import os
+from array import array
+from typing import Iterable, Set
+
+
+class ReviewIdIndex:
+    """
+    상품별 리뷰 ID 인덱스.
+
+    ID를 int64 배열 그대로 바이너리 파일에 저장합니다. 새 배치의 ID는 파일 끝에
+    덧붙이기만 하고(append-only), compact()에서 정렬 + 중복 제거합니다.
+    3만 개 ID도 240KB 정도라 JSON 전체를 파싱하는 것보다 훨씬 빠르게 로드됩니다.
+    """
+
+    TYPECODE = "q"  # signed int64
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def _read_array(self) -> array:
+        ids = array(self.TYPECODE)
+        if not self.exists():
+            return ids
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # 비정상 종료로 잘린 마지막 항목은 버림
+        usable = len(data) - (len(data) % ids.itemsize)
+        ids.frombytes(data[:usable])
+        return ids
+
+    def load(self) -> Set[int]:
+        """인덱스의 모든 ID를 set으로 반환합니다."""
+        return set(self._read_array())
+
+    def add(self, ids: Iterable[int]) -> int:
+        """ID들을 파일 끝에 추가하고 추가한 개수를 반환합니다."""
+        new_ids = array(self.TYPECODE, (int(i) for i in ids))
+        if not new_ids:
+            return 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "ab") as f:
+            new_ids.tofile(f)
+        return len(new_ids)
+
+    def rebuild(self, ids: Iterable[int]) -> int:
+        """주어진 ID로 인덱스를 새로 만듭니다 (정렬 + 중복 제거)."""
+        sorted_ids = array(self.TYPECODE, sorted({int(i) for i in ids}))
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            sorted_ids.tofile(f)
+        os.replace(tmp_path, self.path)
+        return len(sorted_ids)
+
+    def compact(self) -> int:
+        """덧붙인 ID까지 포함해 정렬된 배열로 다시 씁니다."""
+        return self.rebuild(self._read_array())
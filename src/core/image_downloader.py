@@ -0,0 +1,281 @@
+# src/core/image_downloader.py
+"""
+리뷰 첨부 이미지 다운로더.
+
+스냅샷의 이미지 URL(APMall imgList[].imageFileUrl, Naver reviewAttaches[].attachUrl)을
+asyncio 세마포어로 동시 요청 수를 제한해 받습니다. HTTP 요청 자체는 크롤러와 같은
+requests 세션(스레드별)으로 executor 스레드에서 실행합니다.
+
+- 저장 위치: data/images/<sha256 앞 2자리>/<sha256>.<확장자> (원본 바이트 해시, 같은 이미지는 한 번만 저장)
+  --max-size 로 축소 재인코딩한 이미지는 <sha256>.w<max_size>.jpg (원본과 이름이 겹치지 않음)
+- manifest.jsonl: 한 줄에 (site, review_id, product, url, file, sha256, stored_sha256, bytes, max_size) 하나,
+  추가만 함 (sha256 = 원본 해시, stored_sha256 · bytes = 저장된 파일, max_size = 축소했으면 그 크기)
+- 재실행 시 manifest에 있고 파일도 있는 URL은 네트워크 요청 없이 건너뜁니다.
+"""
+import asyncio
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from src.core.config import (
+    APMALL_HEADERS,
+    DATA_IMAGES_DIR,
+    DATA_RAW_DIR,
+    IMAGE_CONCURRENCY,
+    IMAGE_MAX_RPS,
+    IMAGE_MAX_SIZE,
+    IMAGE_TIMEOUT,
+)
+from src.core.rate_limiter import get_host_limiter
+from src.core.review_store import REVIEW_FIELDS
+from src.core.writers import iter_reviews, review_output_files
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+}
+
+
+def review_image_urls(site: str, review: dict) -> List[str]:
+    """리뷰 하나의 첨부 이미지 URL 목록"""
+    if site == "apmall":
+        return [image["imageFileUrl"] for image in review.get("imgList") or [] if image.get("imageFileUrl")]
+    if site == "naver":
+        return [
+            attach["attachUrl"]
+            for attach in review.get("reviewAttaches") or []
+            if attach.get("attachUrl") and attach.get("reviewAttachmentType", "I") == "I"
+        ]
+    return []
+
+
+def iter_image_jobs(sites: List[str], raw_dir: Optional[str] = None) -> Iterator[Tuple[str, int, str, str]]:
+    """스냅샷 전체에서 (site, review_id, product, url) 를 순회"""
+    for site in sites:
+        id_field = REVIEW_FIELDS[site]["id"]
+        for file_path in review_output_files(raw_dir or DATA_RAW_DIR, site):
+            product = os.path.basename(file_path)[len(f"{site}_reviews_"):].split(".")[0]
+            for review in iter_reviews(file_path):
+                review_id = review.get(id_field)
+                if review_id is None:
+                    continue
+                for url in review_image_urls(site, review):
+                    yield site, int(review_id), product, url
+
+
+class ImageDownloader:
+    """
+    리뷰 이미지 다운로더 (재실행 가능).
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        max_size: Optional[int] = None,
+        max_rps: Optional[float] = None,
+    ):
+        self.root = root or DATA_IMAGES_DIR
+        self.concurrency = concurrency or IMAGE_CONCURRENCY
+        self.max_size = max_size if max_size is not None else IMAGE_MAX_SIZE
+        self.max_rps = max_rps or IMAGE_MAX_RPS
+        self.manifest_path = os.path.join(self.root, "manifest.jsonl")
+        self._local = threading.local()
+
+        # url -> manifest 레코드 (파일 경로, 해시 등)
+        self.downloaded: Dict[str, dict] = {}
+        # (site, review_id, url) 이미 manifest에 있는 연결
+        self.linked = set()
+        self.stats = {"downloaded": 0, "skipped": 0, "linked": 0, "deduplicated": 0, "failed": 0, "bytes": 0}
+
+        if self.max_size:
+            try:
+                import PIL  # noqa: F401
+            except ImportError:
+                print("⚠️  Pillow가 설치되어 있지 않아 원본 크기로 저장합니다. (pip install Pillow)")
+                self.max_size = None
+
+    # ------------------------------------------------------------------
+    # manifest
+    # ------------------------------------------------------------------
+    def load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 비정상 종료로 잘린 마지막 줄
+                self.downloaded[record["url"]] = record
+                self.linked.add((record["site"], record["review_id"], record["url"]))
+
+    def _append_manifest(self, manifest, record: dict):
+        manifest.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.linked.add((record["site"], record["review_id"], record["url"]))
+
+    def _is_present(self, url: str) -> bool:
+        """이번 설정으로 받은 것과 같은 파일이 있으면 True (축소본은 같은 max_size일 때만)"""
+        record = self.downloaded.get(url)
+        if record is None or record.get("max_size") not in (None, self.max_size):
+            return False
+        return os.path.exists(os.path.join(self.root, record["file"]))
+
+    # ------------------------------------------------------------------
+    # 다운로드 (executor 스레드)
+    # ------------------------------------------------------------------
+    def _get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers["User-Agent"] = APMALL_HEADERS["User-Agent"]
+            self._local.session = session
+        return session
+
+    def _downscale(self, content: bytes) -> Tuple[bytes, bool]:
+        """긴 변이 max_size를 넘으면 줄여 JPEG로 재인코딩. (바이트, 재인코딩 여부)"""
+        from PIL import Image, ImageOps
+
+        with Image.open(io.BytesIO(content)) as image:
+            if max(image.size) <= self.max_size:
+                return content, False
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((self.max_size, self.max_size))
+            output = io.BytesIO()
+            image.convert("RGB").save(output, format="JPEG", quality=85)
+            return output.getvalue(), True
+
+    def _download(self, url: str) -> dict:
+        """이미지 하나를 받아 해시 경로에 저장하고 manifest 레코드 일부를 반환"""
+        get_host_limiter(url, self.max_rps).acquire()
+        response = self._get_session().get(url, timeout=IMAGE_TIMEOUT)
+        response.raise_for_status()
+        content = response.content
+
+        sha256 = hashlib.sha256(content).hexdigest()
+        content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+        extension = CONTENT_TYPE_EXTENSIONS.get(content_type) or os.path.splitext(url.split("?")[0])[1].lower() or ".jpg"
+
+        # 축소본은 원본과 다른 이름이므로 max_size 없이 받을 때 원본으로 오인하지 않음
+        resized = os.path.join(sha256[:2], f"{sha256}.w{self.max_size}.jpg") if self.max_size else None
+        if resized and os.path.exists(os.path.join(self.root, resized)):
+            return {**self._stored_record(resized, sha256, self.max_size), "deduplicated": True}
+
+        reencoded = False
+        if self.max_size:
+            content, reencoded = self._downscale(content)
+        relative = resized if reencoded else os.path.join(sha256[:2], sha256 + extension)
+        max_size = self.max_size if reencoded else None
+        path = os.path.join(self.root, relative)
+        if os.path.exists(path):
+            return {**self._stored_record(relative, sha256, max_size), "deduplicated": True}
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        return {**self._stored_record(relative, sha256, max_size, content), "deduplicated": False}
+
+    def _stored_record(self, relative: str, sha256: str, max_size: Optional[int], content: Optional[bytes] = None) -> dict:
+        """저장된 파일의 manifest 필드 (content가 없으면 디스크의 파일을 읽어 해시)"""
+        if content is None:
+            with open(os.path.join(self.root, relative), "rb") as f:
+                content = f.read()
+        return {
+            "file": relative,
+            "sha256": sha256,
+            "stored_sha256": hashlib.sha256(content).hexdigest(),
+            "bytes": len(content),
+            "max_size": max_size,
+        }
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    async def _run(self, jobs: Dict[str, List[Tuple[str, int, str]]]):
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="image")
+        total = len(jobs)
+        done = 0
+
+        with open(self.manifest_path, "a", encoding="utf-8") as manifest:
+
+            def report_progress():
+                nonlocal done
+                done += 1
+                if done % 100 == 0 or done == total:
+                    print(f"  [{done}/{total}] 받음 {self.stats['downloaded']} · 실패 {self.stats['failed']}")
+
+            async def fetch(url: str, reviews: List[Tuple[str, int, str]]):
+                async with semaphore:
+                    try:
+                        result = await loop.run_in_executor(executor, self._download, url)
+                    except Exception as e:
+                        self.stats["failed"] += 1
+                        print(f"  ⚠️  이미지 다운로드 실패 ({url}): {e}")
+                        report_progress()
+                        return
+
+                self.stats["downloaded"] += 1
+                self.stats["bytes"] += result["bytes"]
+                if result.pop("deduplicated"):
+                    self.stats["deduplicated"] += 1
+                for site, review_id, product in reviews:
+                    record = {"site": site, "review_id": review_id, "product": product, "url": url, **result}
+                    self._append_manifest(manifest, record)
+                self.downloaded[url] = {"url": url, **result}
+                manifest.flush()
+                report_progress()
+
+            await asyncio.gather(*(fetch(url, reviews) for url, reviews in jobs.items()))
+        executor.shutdown(wait=True)
+
+    def run(self, sites: List[str], raw_dir: Optional[str] = None) -> Dict[str, int]:
+        """스냅샷의 이미지 중 아직 없는 것만 받습니다."""
+        self.load_manifest()
+
+        jobs: Dict[str, List[Tuple[str, int, str]]] = {}
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.manifest_path, "a", encoding="utf-8") as manifest:
+            for site, review_id, product, url in iter_image_jobs(sites, raw_dir):
+                if (site, review_id, url) in self.linked and self._is_present(url):
+                    self.stats["skipped"] += 1
+                elif self._is_present(url):
+                    # 다른 리뷰에서 이미 받은 이미지 -> 연결만 추가
+                    record = {**self.downloaded[url], "site": site, "review_id": review_id, "product": product}
+                    self._append_manifest(manifest, record)
+                    self.stats["linked"] += 1
+                else:
+                    reviews = jobs.setdefault(url, [])
+                    if (site, review_id, product) not in reviews:
+                        reviews.append((site, review_id, product))
+
+        print(f"이미지 {len(jobs):,}개 다운로드 예정 (이미 있음 {self.stats['skipped']:,}개)")
+        if jobs:
+            asyncio.run(self._run(jobs))
+        return self.stats
+
+
+def run_download_images_cli(sites: List[str], concurrency: Optional[int] = None, max_size: Optional[int] = None):
+    """main.py download-images 처리"""
+    started = time.perf_counter()
+    downloader = ImageDownloader(concurrency=concurrency, max_size=max_size)
+    stats = downloader.run(sites)
+    elapsed = time.perf_counter() - started
+    print(
+        f"\n이미지 다운로드 완료: 받음 {stats['downloaded']:,} (중복 내용 {stats['deduplicated']:,}) · "
+        f"건너뜀 {stats['skipped']:,} · 연결 {stats['linked']:,} · 실패 {stats['failed']:,} · "
+        f"{stats['bytes'] / 1024 / 1024:.1f}MB · {elapsed:.1f}s"
+    )
+    print(f"manifest: {downloader.manifest_path}")
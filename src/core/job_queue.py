@@ -0,0 +1,271 @@
+# src/core/job_queue.py
+"""
+리스(lease) 기반 크롤링 작업 큐 (SQLite).
+
+targets.xlsx 의 상품을 큐 이름(--queue, 예: 날짜) 단위로 작업으로 넣고, 여러 프로세스/호스트의
+크롤러가 같은 DB 파일에서 상품을 하나씩 가져갑니다.
+
+- claim: 대기 중이거나 리스가 만료된 작업 하나를 원자적으로 가져가고 리스 만료 시각을 설정
+- heartbeat: 작업 중인 워커가 주기적으로 리스를 연장 (LeaseHeartbeat 스레드)
+- complete / fail: 완료 보고, 실패 시 최대 시도 횟수까지 다시 대기 상태로 (release: 중단 시 반납)
+- 워커가 죽으면 리스가 만료되어 다른 워커가 가져감 (네이버/APMall 모두 이어서 크롤링 지원)
+
+공유 디렉토리(NFS 등)에서도 쓸 수 있도록 WAL 대신 기본 rollback 저널을 사용하고,
+쓰기는 BEGIN IMMEDIATE 트랜잭션으로 직렬화합니다. 리스 시각은 각 호스트의 시계를
+기준으로 하므로 호스트 간 시계는 동기화(NTP)되어 있어야 합니다.
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.config import JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS, JOB_QUEUE_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id            INTEGER PRIMARY KEY,
+    queue         TEXT    NOT NULL,
+    site          TEXT    NOT NULL,
+    job_key       TEXT    NOT NULL,
+    url           TEXT    NOT NULL,
+    state         TEXT    NOT NULL DEFAULT 'pending',  -- pending / leased / done / failed
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    worker        TEXT,
+    lease_expires REAL,
+    last_error    TEXT,
+    result        TEXT,
+    created_at    REAL    NOT NULL,
+    updated_at    REAL    NOT NULL,
+    UNIQUE (queue, site, job_key)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (queue, site, state, lease_expires);
+"""
+
+
+def default_worker_id() -> str:
+    """호스트:PID:스레드 이름"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+
+
+class Job:
+    def __init__(self, row: sqlite3.Row, worker: str):
+        self.id = row["id"]
+        self.site = row["site"]
+        self.key = row["job_key"]
+        self.url = row["url"]
+        self.attempts = row["attempts"]
+        self.worker = worker
+
+    def __repr__(self):
+        return f"Job({self.site}:{self.key}, attempt {self.attempts})"
+
+
+class JobQueue:
+    """SQLite 작업 큐. 호출마다 연결을 새로 열어 스레드/프로세스 간에 안전하게 사용합니다."""
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        self.name = name
+        self.path = path or JOB_QUEUE_PATH
+        self.lease_seconds = lease_seconds or JOB_LEASE_SECONDS
+        self.max_attempts = max_attempts or JOB_MAX_ATTEMPTS
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def seed(self, site: str, jobs: Iterable[Tuple[str, str]]) -> int:
+        """(job_key, url) 목록을 넣습니다. 이미 있는 작업은 건너뛰므로 여러 워커가 같이 호출해도 됩니다."""
+        now = time.time()
+        rows = [(self.name, site, str(key), url, now, now) for key, url in jobs]
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (queue, site, job_key, url, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            inserted = conn.total_changes - before
+            conn.execute("COMMIT")
+            return inserted
+        finally:
+            conn.close()
+
+    def claim(self, site: str, worker: Optional[str] = None) -> Optional[Job]:
+        """
+        대기 중이거나 리스가 만료된 작업 하나를 가져갑니다. 없으면 None.
+        마지막 시도에서 리스가 만료된 작업(워커가 죽음)은 같은 트랜잭션에서 failed로 넘깁니다.
+        """
+        worker = worker or default_worker_id()
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'failed', lease_expires = NULL, last_error = 'lease expired', updated_at = ?
+                WHERE queue = ? AND site = ? AND state = 'leased' AND lease_expires < ? AND attempts >= ?
+                """,
+                (now, self.name, site, now, self.max_attempts),
+            )
+            row = conn.execute(
+                """
+                SELECT id FROM jobs
+                WHERE queue = ? AND site = ? AND attempts < ?
+                  AND (state = 'pending' OR (state = 'leased' AND lease_expires < ?))
+                ORDER BY attempts, id
+                LIMIT 1
+                """,
+                (self.name, site, self.max_attempts, now),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'leased', worker = ?, lease_expires = ?,
+                                attempts = attempts + 1, updated_at = ?
+                WHERE id = ?
+                """,
+                (worker, now + self.lease_seconds, now, row["id"]),
+            )
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+            conn.execute("COMMIT")
+            return Job(job, worker)
+        finally:
+            conn.close()
+
+    def _update_owned(self, job: Job, sql: str, params: tuple) -> bool:
+        """아직 이 워커가 리스를 가진 작업만 갱신합니다."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(f"{sql} WHERE id = ? AND worker = ? AND state = 'leased'", (*params, job.id, job.worker))
+            return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def heartbeat(self, job: Job) -> bool:
+        """리스를 연장합니다. 리스를 잃었으면(만료 후 다른 워커가 가져감) False."""
+        now = time.time()
+        return self._update_owned(
+            job, "UPDATE jobs SET lease_expires = ?, updated_at = ?", (now + self.lease_seconds, now)
+        )
+
+    def complete(self, job: Job, result: Optional[Dict[str, Any]] = None) -> bool:
+        return self._update_owned(
+            job,
+            "UPDATE jobs SET state = 'done', lease_expires = NULL, result = ?, updated_at = ?",
+            (json.dumps(result or {}, ensure_ascii=False), time.time()),
+        )
+
+    def fail(self, job: Job, error: str) -> bool:
+        """실패 보고. 시도 횟수가 남았으면 다시 대기 상태로, 아니면 failed."""
+        state = "pending" if job.attempts < self.max_attempts else "failed"
+        return self._update_owned(
+            job,
+            "UPDATE jobs SET state = ?, lease_expires = NULL, last_error = ?, updated_at = ?",
+            (state, error[:500], time.time()),
+        )
+
+    def release(self, job: Job) -> bool:
+        """시도 횟수를 되돌리고 대기 상태로 (Ctrl+C 등으로 작업을 끝내지 못하고 종료할 때)"""
+        return self._update_owned(
+            job,
+            "UPDATE jobs SET state = 'pending', lease_expires = NULL, attempts = attempts - 1, updated_at = ?",
+            (time.time(),),
+        )
+
+    def counts(self, site: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """사이트별 상태별 작업 수 (만료된 리스는 'expired')"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                """
+                SELECT site,
+                       CASE WHEN state = 'leased' AND lease_expires < ? THEN 'expired' ELSE state END AS state,
+                       COUNT(*) AS jobs
+                FROM jobs WHERE queue = ? AND (? IS NULL OR site = ?)
+                GROUP BY 1, 2
+                """,
+                (time.time(), self.name, site, site),
+            ).fetchall()
+        finally:
+            conn.close()
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row["site"], {})[row["state"]] = row["jobs"]
+        return counts
+
+    def failures(self, site: Optional[str] = None) -> List[sqlite3.Row]:
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT site, job_key, attempts, worker, last_error FROM jobs "
+                "WHERE queue = ? AND (? IS NULL OR site = ?) AND last_error IS NOT NULL AND state != 'done' ORDER BY site, id",
+                (self.name, site, site),
+            ).fetchall()
+        finally:
+            conn.close()
+
+
+class LeaseHeartbeat:
+    """작업을 처리하는 동안 백그라운드 스레드로 리스를 연장합니다."""
+
+    def __init__(self, job_queue: JobQueue, job: Job):
+        self.job_queue = job_queue
+        self.job = job
+        self.interval = max(1.0, job_queue.lease_seconds / 3)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{job.key}", daemon=True)
+        self.lost = False
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.job_queue.heartbeat(self.job):
+                    self.lost = True
+                    print(f"⚠️  [{self.job.site}:{self.job.key}] 작업 리스를 잃었습니다 (다른 워커가 가져감)")
+                    return
+            except sqlite3.Error as e:
+                print(f"⚠️  [{self.job.site}:{self.job.key}] 하트비트 실패: {e}")
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+
+def run_queue_status_cli(name: str, site: Optional[str] = None, path: Optional[str] = None):
+    """main.py queue 처리: 큐 상태와 실패 작업 출력"""
+    job_queue = JobQueue(name, path)
+    counts = job_queue.counts(site)
+    if not counts:
+        print(f"큐 '{name}' 에 작업이 없습니다. ({job_queue.path})")
+        return
+    states = ["pending", "leased", "expired", "done", "failed"]
+    print(f"큐 '{name}' ({job_queue.path})")
+    print(f"{'site':8} " + " ".join(f"{state:>8}" for state in states))
+    for site_name, site_counts in sorted(counts.items()):
+        print(f"{site_name:8} " + " ".join(f"{site_counts.get(state, 0):>8}" for state in states))
+    for row in job_queue.failures(site):
+        print(f"  [{row['site']}] {row['job_key']} 시도 {row['attempts']}회 ({row['worker']}): {row['last_error']}")
@@ -0,0 +1,144 @@
+# src/core/multi_site.py
+"""
+여러 사이트 크롤러 동시 실행 (main.py --site all / --site apmall,naver).
+
+사이트마다 별도 프로세스에서 크롤러를 실행하고 출력은 data/logs/<site>_<시각>.log 로
+분리합니다. 각 프로세스는 끝날 때 run_stats 요약을 큐로 돌려주고, 부모 프로세스는
+모든 사이트가 끝나면 사이트별 리뷰 수 · 요청 수 · 바이트 · 소요 시간을 합쳐 출력합니다.
+"""
+import multiprocessing
+import os
+import queue
+import sys
+import time
+import traceback
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from src.core.config import DATA_LOGS_DIR
+
+# 등록된 크롤러 (main.py --site 값)
+SITES = ["apmall", "naver"]
+
+STATUS_INTERVAL = 60  # 진행 상황(각 로그 마지막 줄) 출력 간격 (초)
+
+
+def parse_sites(value: str) -> List[str]:
+    """--site 값을 사이트 목록으로 변환 ("all" 또는 쉼표 구분)"""
+    sites = []
+    for site in (part.strip() for part in value.split(",")):
+        for name in SITES if site == "all" else [site]:
+            if name and name not in sites:
+                sites.append(name)
+    return sites
+
+
+def _run_site(site: str, args, create_crawler: Callable, log_path: str, results):
+    """자식 프로세스: 출력을 로그 파일로 돌리고 크롤러 하나를 실행"""
+    log = open(log_path, "a", encoding="utf-8", buffering=1)
+    sys.stdout = sys.stderr = log
+
+    result = {"site": site, "status": "ok", "log": log_path}
+    started = time.time()
+    crawler = None
+    try:
+        crawler = create_crawler(site, args)
+        if crawler is None:
+            result["status"] = "failed"
+        else:
+            crawler.run()
+    except BaseException as e:
+        traceback.print_exc()
+        result["status"] = "interrupted" if isinstance(e, KeyboardInterrupt) else "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        if crawler is not None:
+            result["stats"] = crawler.run_stats.summary()
+            result["output_dir"] = crawler.current_output_dir
+        result["duration_seconds"] = round(time.time() - started, 1)
+        results.put(result)
+        log.close()
+
+
+def _last_line(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 2048))
+            lines = [line for line in f.read().decode("utf-8", "replace").splitlines() if line.strip()]
+        return lines[-1].strip()[:100] if lines else ""
+    except OSError:
+        return ""
+
+
+def run_sites(sites: List[str], args, create_crawler: Callable) -> Dict[str, dict]:
+    """사이트별 프로세스를 동시에 실행하고 통합 요약을 출력합니다."""
+    os.makedirs(DATA_LOGS_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    results = multiprocessing.Queue()
+
+    processes = {}
+    for site in sites:
+        log_path = os.path.join(DATA_LOGS_DIR, f"{site}_{timestamp}.log")
+        process = multiprocessing.Process(
+            target=_run_site,
+            args=(site, args, create_crawler, log_path, results),
+            name=f"crawl-{site}",
+        )
+        process.start()
+        processes[site] = (process, log_path)
+        print(f"[{site}] started (pid {process.pid}) -> {log_path}")
+
+    summaries: Dict[str, dict] = {}
+    try:
+        while len(summaries) < len(processes):
+            try:
+                result = results.get(timeout=STATUS_INTERVAL)
+            except queue.Empty:
+                # 결과 없이 죽은 프로세스 확인 + 진행 상황 출력
+                for site, (process, log_path) in processes.items():
+                    if site in summaries:
+                        continue
+                    if not process.is_alive():
+                        summaries[site] = {"site": site, "status": f"exited ({process.exitcode})", "log": log_path}
+                    else:
+                        print(f"[{site}] {_last_line(log_path)}")
+                continue
+            summaries[result["site"]] = result
+            print(f"[{result['site']}] {result['status']} ({result['duration_seconds']}s)")
+    except KeyboardInterrupt:
+        print("\nInterrupted, waiting for site processes to stop...")
+    finally:
+        for process, _ in processes.values():
+            process.join()
+
+    print_summary(sites, summaries)
+    return summaries
+
+
+def print_summary(sites: List[str], summaries: Dict[str, dict]):
+    print("\n" + "=" * 78)
+    print(f"{'site':8} {'status':12} {'reviews':>9} {'requests':>9} {'errors':>7} {'MB':>9} {'duration':>10}")
+    print("-" * 78)
+    totals = {"reviews": 0, "requests": 0, "errors": 0, "bytes": 0}
+    for site in sites:
+        summary = summaries.get(site, {"status": "missing"})
+        stats = summary.get("stats") or {}
+        for key in totals:
+            totals[key] += stats.get(key, 0)
+        duration = summary.get("duration_seconds")
+        print(
+            f"{site:8} {summary['status']:12} {stats.get('reviews', 0):>9,} {stats.get('requests', 0):>9,} "
+            f"{stats.get('errors', 0):>7,} {stats.get('bytes', 0) / 1024 / 1024:>9.1f} "
+            f"{time.strftime('%H:%M:%S', time.gmtime(duration)) if duration is not None else '-':>10}"
+        )
+    print("-" * 78)
+    print(
+        f"{'total':8} {'':12} {totals['reviews']:>9,} {totals['requests']:>9,} "
+        f"{totals['errors']:>7,} {totals['bytes'] / 1024 / 1024:>9.1f}"
+    )
+    print("=" * 78)
+    for site in sites:
+        summary = summaries.get(site, {})
+        if summary.get("error"):
+            print(f"[{site}] {summary['error']} (see {summary.get('log')})")
@@ -0,0 +1,183 @@
+# src/core/pacing.py
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from src.core.config import RATE_CONTROL
+from src.core.rate_limiter import RateLimiter
+
+
+class PacingController:
+    """
+    여러 워커가 공유하는 페이싱/쿨다운 컨트롤러.
+
+    - wait(): 요청 전에 호출. 공유 요청 예산(RateLimiter)을 지키고,
+      쿨다운 중이면 끝날 때까지 대기합니다.
+    - trigger_cooldown(): 한 워커에서 차단/연속 실패가 감지되면 호출.
+      모든 워커의 다음 요청이 쿨다운이 끝날 때까지 멈춥니다.
+    """
+
+    def __init__(self, max_rps: float, burst: int = 1):
+        self.limiter = RateLimiter(max_rps, burst)
+        self._cooldown_until = 0.0
+        self._cooldown_reason: Optional[str] = None
+        self._lock = threading.Lock()
+        self.cooldowns = 0
+
+    def cooldown_remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self._cooldown_until - time.monotonic())
+
+    def trigger_cooldown(self, seconds: float, reason: str = ""):
+        """모든 워커에 적용되는 쿨다운을 시작(또는 연장)합니다."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._cooldown_until:
+                self._cooldown_until = until
+                self._cooldown_reason = reason
+            self.cooldowns += 1
+
+    def wait(self):
+        """쿨다운이 끝나고 요청 예산이 생길 때까지 대기합니다."""
+        while True:
+            remaining = self.cooldown_remaining()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 5.0))
+        self.limiter.acquire()
+
+
+class AdaptivePacingController(PacingController):
+    """
+    응답 신호로 요청 속도를 조절하는 페이싱 컨트롤러 (AIMD).
+
+    - record_success(latency): 성공 응답. success_window 번 연속 성공하면 속도를
+      increase_step 만큼 올립니다 (max_rate 까지).
+    - 응답 지연 EWMA가 기준(관측된 최소 EWMA)의 latency_factor 배와 latency_slack 초를 넘으면
+      latency_decrease_factor 배, 429/5xx/연결 오류(record_error)는 decrease_factor 배로
+      낮춥니다 (min_rate 까지). 감속 후 decrease_interval 안의 신호는 한 번으로 취급합니다.
+    - 차단 감지(record_block)와 429는 속도를 낮추고 모든 워커에 쿨다운을 겁니다.
+      쿨다운 길이는 cooldown_base 부터 회복 없이 연속될 때마다 두 배 (cooldown_max 까지).
+    - rate / snapshot(): 현재 속도와 조절 내역 (run_meta["rate_control"])
+    """
+
+    HISTORY_SIZE = 50
+    LATENCY_ALPHA = 0.2  # 지연 EWMA 가중치
+    LATENCY_WARMUP = 5  # 기준 지연을 잡기 전에 모을 표본 수
+
+    def __init__(self, initial_rate: float, min_rate: float, max_rate: float, settings: Optional[dict] = None):
+        self.settings = {**RATE_CONTROL, **(settings or {})}
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max(max_rate, self.min_rate))
+        super().__init__(min(max(initial_rate, self.min_rate), self.max_rate))
+
+        self.latency_ewma: Optional[float] = None
+        self.latency_baseline: Optional[float] = None
+        self._latency_samples = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._consecutive_blocks = 0
+        self.counts = {"successes": 0, "errors": 0, "blocks": 0, "increases": 0, "decreases": 0}
+        self.peak_rate = self.limiter.rate
+        self.history: List[Tuple[float, float, str]] = []
+        self._started = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self.limiter.rate
+
+    def _set_rate(self, rate: float, reason: str):
+        rate = min(max(rate, self.min_rate), self.max_rate)
+        if rate == self.limiter.rate:
+            return
+        self.limiter.set_rate(rate)
+        self.peak_rate = max(self.peak_rate, rate)
+        self.history.append((round(time.monotonic() - self._started, 1), round(rate, 3), reason))
+        del self.history[:-self.HISTORY_SIZE]
+
+    def _decrease(self, factor: float, reason: str) -> bool:
+        """호출자가 _lock 을 잡은 상태에서 호출. 최근에 이미 낮췄으면 False."""
+        now = time.monotonic()
+        self._successes = 0
+        if now - self._last_decrease < self.settings["decrease_interval"]:
+            return False
+        self._last_decrease = now
+        self.counts["decreases"] += 1
+        self._set_rate(self.limiter.rate * factor, reason)
+        return True
+
+    def record_success(self, latency: Optional[float] = None):
+        """성공 응답 (latency: 요청부터 응답까지 초, 모르면 None)"""
+        with self._lock:
+            self.counts["successes"] += 1
+            if latency is not None and latency >= 0:
+                self._latency_samples += 1
+                if self.latency_ewma is None:
+                    self.latency_ewma = latency
+                else:
+                    self.latency_ewma += self.LATENCY_ALPHA * (latency - self.latency_ewma)
+                if self._latency_samples >= self.LATENCY_WARMUP:
+                    if self.latency_baseline is None or self.latency_ewma < self.latency_baseline:
+                        self.latency_baseline = self.latency_ewma
+                    elif (
+                        self.latency_ewma > self.latency_baseline * self.settings["latency_factor"]
+                        and self.latency_ewma - self.latency_baseline > self.settings["latency_slack"]
+                    ):
+                        self._decrease(
+                            self.settings["latency_decrease_factor"],
+                            f"latency {self.latency_ewma:.2f}s",
+                        )
+                        return
+
+            self._successes += 1
+            if self._successes >= self.settings["success_window"]:
+                self._successes = 0
+                self._consecutive_blocks = 0
+                if self.limiter.rate < self.max_rate:
+                    self.counts["increases"] += 1
+                    self._set_rate(self.limiter.rate + self.settings["increase_step"], "increase")
+
+    def record_error(self, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        실패 응답. 429/5xx 와 연결 오류(status=None)만 속도를 낮추고, 그 밖의 4xx는 무시합니다.
+        429는 쿨다운도 시작합니다 (Retry-After 가 있으면 그 시간).
+        """
+        if status is not None and status != 429 and status < 500:
+            return
+        reason = f"status {status}" if status is not None else "connection error"
+        with self._lock:
+            self.counts["errors"] += 1
+            self._decrease(self.settings["decrease_factor"], reason)
+        if status == 429:
+            self.trigger_cooldown(retry_after or self.cooldown_seconds(), reason)
+
+    def record_block(self, reason: str = "") -> float:
+        """차단 감지: 속도를 낮추고 쿨다운을 시작합니다. 적용한 쿨다운 길이(초)를 반환."""
+        with self._lock:
+            self.counts["blocks"] += 1
+            self._last_decrease = 0.0  # 차단은 직전 감속과 상관없이 반영
+            self._decrease(self.settings["decrease_factor"], f"blocked: {reason}" if reason else "blocked")
+            self._consecutive_blocks += 1
+        seconds = self.cooldown_seconds()
+        self.trigger_cooldown(seconds, reason)
+        return seconds
+
+    def cooldown_seconds(self) -> float:
+        """연속 차단 횟수에 따른 쿨다운 길이"""
+        blocks = max(1, self._consecutive_blocks)
+        return min(self.settings["cooldown_base"] * 2 ** (blocks - 1), self.settings["cooldown_max"])
+
+    def snapshot(self) -> dict:
+        """현재 속도와 조절 내역 (run_meta 기록용)"""
+        with self._lock:
+            return {
+                "rate": round(self.limiter.rate, 3),
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "peak_rate": round(self.peak_rate, 3),
+                "latency_ewma": round(self.latency_ewma, 3) if self.latency_ewma is not None else None,
+                "latency_baseline": round(self.latency_baseline, 3) if self.latency_baseline is not None else None,
+                "cooldowns": self.cooldowns,
+                **self.counts,
+                "history": list(self.history),
+            }
@@ -0,0 +1,64 @@
+# src/core/rate_limiter.py
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class RateLimiter:
+    """
+    토큰 버킷 기반 요청 속도 제한기.
+    여러 스레드(워커)가 하나의 인스턴스를 공유하면 전체 요청 수가
+    초당 `rate` 개를 넘지 않도록 조절합니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._last
+        self._last = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def set_rate(self, rate: float):
+        """초당 요청 수를 바꿉니다. 이미 쌓인 토큰은 이전 속도로 계산합니다."""
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_host_limiters = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(url_or_host: str, rate: float, burst: int = 1) -> RateLimiter:
+    """
+    호스트별로 하나의 RateLimiter를 반환합니다.
+    같은 호스트에 대해서는 항상 같은 인스턴스를 공유합니다.
+    """
+    host = urlparse(url_or_host).netloc or url_or_host
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(rate, burst)
+            _host_limiters[host] = limiter
+        return limiter
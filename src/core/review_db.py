@@ -0,0 +1,218 @@
+# src/core/review_db.py
+"""
+SQLite 리뷰 DB.
+
+리뷰를 (site, review_id) 자연키로 upsert 하고, 상품/작성일/평점 인덱스로
+중복 확인, 이어서 크롤링, "지난 실행 이후 신규 리뷰" 조회를 처리합니다.
+"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.core.config import REVIEW_DB_PATH
+from src.core.review_store import REVIEW_FIELDS, ReviewSink, parse_timestamp
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    site        TEXT    NOT NULL,
+    review_id   INTEGER NOT NULL,
+    product_id  TEXT    NOT NULL,
+    created_at  TEXT,
+    score       INTEGER,
+    body        TEXT,
+    raw         TEXT    NOT NULL,
+    first_seen  TEXT    NOT NULL,
+    last_seen   TEXT    NOT NULL,
+    PRIMARY KEY (site, review_id)
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_product ON reviews (site, product_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_reviews_created ON reviews (created_at);
+CREATE INDEX IF NOT EXISTS idx_reviews_score ON reviews (site, score);
+CREATE INDEX IF NOT EXISTS idx_reviews_first_seen ON reviews (first_seen);
+"""
+
+UPSERT = """
+INSERT INTO reviews (site, review_id, product_id, created_at, score, body, raw, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (site, review_id) DO UPDATE SET
+    product_id = excluded.product_id,
+    created_at = excluded.created_at,
+    score      = excluded.score,
+    body       = excluded.body,
+    raw        = excluded.raw,
+    last_seen  = excluded.last_seen
+"""
+
+
+class ReviewDatabase:
+    """리뷰 SQLite DB (스레드 간 공유 가능, 쓰기는 락으로 직렬화)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or REVIEW_DB_PATH
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def upsert(self, site: str, product_id: str, reviews: Iterable[Dict[str, Any]], seen_at: str) -> int:
+        """리뷰 배치를 한 트랜잭션으로 upsert 하고 처리한 개수를 반환합니다."""
+        fields = REVIEW_FIELDS[site]
+        rows = []
+        for review in reviews:
+            review_id = review.get(fields["id"])
+            if review_id is None:
+                continue
+            created = parse_timestamp(review.get(fields["created"]))
+            rows.append(
+                (
+                    site,
+                    int(review_id),
+                    str(product_id),
+                    created.isoformat() if created else None,
+                    review.get(fields["score"]),
+                    review.get(fields["text"]),
+                    json.dumps(review, ensure_ascii=False),
+                    seen_at,
+                    seen_at,
+                )
+            )
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            self._conn.executemany(UPSERT, rows)
+        return len(rows)
+
+    def existing_ids(self, site: str, product_id: str) -> Set[int]:
+        """상품의 저장된 리뷰 ID (인덱스 조회)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT review_id FROM reviews WHERE site = ? AND product_id = ?",
+                (site, str(product_id)),
+            )
+            return {row[0] for row in cursor}
+
+    def latest_run(self, site: Optional[str] = None) -> Optional[str]:
+        """가장 최근에 리뷰를 처음 저장한 실행 시각"""
+        sql = "SELECT MAX(first_seen) FROM reviews"
+        params: List[Any] = []
+        if site:
+            sql += " WHERE site = ?"
+            params.append(site)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def query(
+        self,
+        site: Optional[str] = None,
+        product_id: Optional[str] = None,
+        min_score: Optional[int] = None,
+        max_score: Optional[int] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        first_seen: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[sqlite3.Row]:
+        """조건에 맞는 리뷰를 최신순으로 조회합니다."""
+        clauses, params = [], []
+        for clause, value in (
+            ("site = ?", site),
+            ("product_id = ?", product_id),
+            ("score >= ?", min_score),
+            ("score <= ?", max_score),
+            ("created_at >= ?", since),
+            ("created_at < ?", until),
+            ("first_seen = ?", first_seen),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = "SELECT site, review_id, product_id, created_at, score, body FROM reviews"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def product_summary(self, site: Optional[str] = None) -> List[sqlite3.Row]:
+        """상품별 리뷰 수 / 평균 평점 / 최신 작성일"""
+        sql = (
+            "SELECT site, product_id, COUNT(*) AS reviews, ROUND(AVG(score), 3) AS avg_score, "
+            "MAX(created_at) AS latest FROM reviews"
+        )
+        params: List[Any] = []
+        if site:
+            sql += " WHERE site = ?"
+            params.append(site)
+        sql += " GROUP BY site, product_id ORDER BY site, reviews DESC"
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+
+class SqliteSink(ReviewSink):
+    """크롤러가 넘기는 배치를 바로 ReviewDatabase에 upsert 하는 sink"""
+
+    name = "sqlite"
+
+    def __init__(self, path: Optional[str] = None):
+        self.db = ReviewDatabase(path)
+        # 이번 실행에서 처음 저장된 리뷰를 구분하기 위한 실행 시각
+        self.run_started = datetime.now().isoformat(timespec="seconds")
+        self.upserted = 0
+
+    def write(self, site, product_id, reviews):
+        self.upserted += self.db.upsert(site, product_id, reviews, self.run_started)
+
+    def close(self):
+        self.db.close()
+
+
+def run_query_cli(args):
+    """main.py query 처리"""
+    db = ReviewDatabase(args.db)
+    site = args.site
+
+    if args.summary:
+        for row in db.product_summary(site):
+            print(
+                f"{row['site']:7} {row['product_id']:>14}  {row['reviews']:>7,}개  "
+                f"평균 {row['avg_score'] or 0:.2f}  최신 {row['latest'] or '-'}"
+            )
+        db.close()
+        return
+
+    first_seen = None
+    if args.new:
+        first_seen = db.latest_run(site)
+        print(f"최근 실행 ({first_seen or '없음'}) 에서 새로 저장된 리뷰")
+
+    rows = db.query(
+        site=site,
+        product_id=args.product,
+        min_score=args.min_score,
+        max_score=args.max_score,
+        since=args.since,
+        until=args.until,
+        first_seen=first_seen,
+        limit=args.limit,
+    )
+    for row in rows:
+        body = (row["body"] or "").replace("\n", " ")
+        print(
+            f"[{row['site']}] {row['product_id']} #{row['review_id']} "
+            f"{(row['created_at'] or '')[:10]} ★{row['score']}  {body[:80]}"
+        )
+    print(f"\n{len(rows)}건")
+    db.close()
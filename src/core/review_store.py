@@ -0,0 +1,232 @@
+# src/core/review_store.py
+"""
+크롤러가 수집한 리뷰를 JSON 외의 저장소에도 기록하기 위한 sink 모음.
+
+BaseCrawler.emit_reviews()가 상품 단위로 리뷰를 넘기면, 등록된 각 sink가
+자신의 형식으로 저장합니다. 사이트별 평탄화 규칙은
+src/sites/<site>/schemas.py 의 FLAT_COLUMNS / flatten_review 에 정의합니다.
+"""
+import importlib
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.core.config import DATA_WAREHOUSE_DIR, PARQUET_FLUSH_ROWS
+
+# 사이트별 공통 필드 매핑 (고유 ID, 작성일, 평점, 본문)
+REVIEW_FIELDS = {
+    "apmall": {
+        "id": "prodReviewSn",
+        "created": "prodReviewRegistDt",
+        "score": "scope",
+        "text": "prodReviewBodyText",
+    },
+    "naver": {
+        "id": "id",
+        "created": "createDate",
+        "score": "reviewScore",
+        "text": "reviewContent",
+    },
+}
+
+
+def get_flat_spec(site: str) -> Tuple[List[Tuple[str, str]], Callable[[dict], dict]]:
+    """사이트의 (FLAT_COLUMNS, flatten_review) 반환"""
+    module = importlib.import_module(f"src.sites.{site}.schemas")
+    return module.FLAT_COLUMNS, module.flatten_review
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """API 날짜 문자열을 UTC datetime으로 변환 (실패 시 None)"""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        try:
+            dt = datetime.fromisoformat(str(value))
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc)
+
+
+class ReviewSink(ABC):
+    """리뷰 저장소 인터페이스"""
+
+    name = "base"
+
+    @abstractmethod
+    def write(self, site: str, product_id: str, reviews: List[Dict[str, Any]]):
+        """상품 하나의 리뷰 일부(페이지/배치)를 기록합니다."""
+
+    def flush(self, site: str, product_id: str):
+        """상품 하나의 수집이 끝났을 때 호출됩니다."""
+
+    def close(self):
+        """실행이 끝났을 때 호출됩니다."""
+
+
+class ParquetSink(ReviewSink):
+    """
+    Parquet 데이터셋 sink.
+
+    data/warehouse/reviews/site=<site>/product=<id>/crawl_date=<YYYY-MM-DD>/
+    아래에 평탄화된 컬럼으로 기록합니다 (hive 파티셔닝).
+    상품 단위로 모아 두었다가 flush() 때 part 파일로 씁니다. 리뷰가 많은 상품은
+    버퍼가 flush_rows 행을 넘을 때마다 part 파일을 먼저 써서 메모리를 일정하게 유지합니다.
+    """
+
+    name = "parquet"
+
+    COLUMN_TYPES = ("int64", "string", "double", "bool", "timestamp", "list<string>")
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        crawl_date: Optional[str] = None,
+        flush_rows: Optional[int] = None,
+    ):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet 저장에는 pyarrow가 필요합니다: pip install pyarrow") from e
+
+        self.root = root or os.path.join(DATA_WAREHOUSE_DIR, "reviews")
+        self.crawl_date = crawl_date or datetime.now().strftime("%Y-%m-%d")
+        self.flush_rows = flush_rows or PARQUET_FLUSH_ROWS
+        self._buffers: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.files_written = 0
+
+    @classmethod
+    def arrow_schema(cls, columns: Sequence[Tuple[str, str]]):
+        import pyarrow as pa
+
+        types = {
+            "int64": pa.int64(),
+            "string": pa.string(),
+            "double": pa.float64(),
+            "bool": pa.bool_(),
+            "timestamp": pa.timestamp("us", tz="UTC"),
+            "list<string>": pa.list_(pa.string()),
+        }
+        return pa.schema([(name, types[kind]) for name, kind in columns])
+
+    def write(self, site, product_id, reviews):
+        if not reviews:
+            return
+        key = (site, str(product_id))
+        buffer = self._buffers.setdefault(key, [])
+        buffer.extend(reviews)
+        if len(buffer) >= self.flush_rows:
+            del self._buffers[key]
+            self._write_part(site, product_id, buffer)
+
+    def flush(self, site, product_id):
+        reviews = self._buffers.pop((site, str(product_id)), None)
+        if reviews:
+            self._write_part(site, product_id, reviews)
+
+    def _write_part(self, site, product_id, reviews):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        columns, flatten = get_flat_spec(site)
+        rows = [flatten(r) for r in reviews]
+        for name, kind in columns:
+            if kind == "timestamp":
+                for row in rows:
+                    row[name] = parse_timestamp(row.get(name))
+
+        table = pa.Table.from_pylist(rows, schema=self.arrow_schema(columns))
+
+        directory = os.path.join(
+            self.root,
+            f"site={site}",
+            f"product={product_id}",
+            f"crawl_date={self.crawl_date}",
+        )
+        os.makedirs(directory, exist_ok=True)
+        part = datetime.now().strftime("%H%M%S%f")
+        file_path = os.path.join(directory, f"part-{part}.parquet")
+        pq.write_table(table, file_path, compression="zstd")
+        self.files_written += 1
+        print(f"[{site}] Parquet: {len(rows)} rows -> {file_path}")
+
+    def close(self):
+        for site, product_id in list(self._buffers):
+            self.flush(site, product_id)
+
+
+def load_reviews(
+    site: str,
+    columns: Optional[List[str]] = None,
+    product_id: Optional[str] = None,
+    root: Optional[str] = None,
+):
+    """
+    Parquet 데이터셋에서 필요한 컬럼만 읽어 pyarrow.Table로 반환합니다.
+    예: load_reviews("naver", ["createDate", "reviewScore"], product_id="4954551987")
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    root = root or os.path.join(DATA_WAREHOUSE_DIR, "reviews")
+    partitioning = ds.partitioning(
+        pa.schema([("product", pa.string()), ("crawl_date", pa.string())]),
+        flavor="hive",
+    )
+    dataset = ds.dataset(
+        os.path.join(root, f"site={site}"), format="parquet", partitioning=partitioning
+    )
+    expression = None
+    if product_id is not None:
+        expression = ds.field("product") == str(product_id)
+    return dataset.to_table(columns=columns, filter=expression)
+
+
+def create_sinks(names: Optional[str]) -> List[ReviewSink]:
+    """'parquet,sqlite' 처럼 쉼표로 구분된 이름 목록으로 sink 생성"""
+    from src.core.review_db import SqliteSink
+
+    factories = {
+        "parquet": ParquetSink,
+        "sqlite": SqliteSink,
+    }
+    sinks = []
+    for name in filter(None, (n.strip() for n in (names or "").split(","))):
+        if name not in factories:
+            raise ValueError(f"Unknown store '{name}' (available: {', '.join(factories)})")
+        sinks.append(factories[name]())
+    return sinks
+
+
+def backfill_raw_snapshots(site: str, sink_factory: Callable[[str], ReviewSink], raw_dir: Optional[str] = None) -> int:
+    """
+    data/raw/<site>/<timestamp>/ 의 기존 JSON 스냅샷을 sink로 옮깁니다.
+    sink_factory는 스냅샷 날짜(YYYY-MM-DD)를 받아 sink를 만듭니다.
+
+    Returns:
+        옮긴 리뷰 수
+    """
+    from src.core.config import DATA_RAW_DIR
+    from src.core.writers import read_reviews, review_output_files
+
+    site_dir = os.path.join(raw_dir or DATA_RAW_DIR, site)
+    total = 0
+    for snapshot in sorted(os.listdir(site_dir)) if os.path.isdir(site_dir) else []:
+        files = review_output_files(raw_dir or DATA_RAW_DIR, site, snapshot)
+        if not files:
+            continue
+        sink = sink_factory(snapshot[:10])
+        for file_path in files:
+            product_id = os.path.basename(file_path)[len(f"{site}_reviews_"):].split(".")[0]
+            reviews = read_reviews(file_path)
+            sink.write(site, product_id, reviews)
+            sink.flush(site, product_id)
+            total += len(reviews)
+        sink.close()
+    return total
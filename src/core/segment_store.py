@@ -0,0 +1,91 @@
+# src/core/segment_store.py
+import gzip
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.core.writers import ReviewWriter
+
+
+class SegmentLog:
+    """
+    상품별 append-only 세그먼트 로그 (JSON Lines, 선택적으로 gzip 압축).
+
+    배치를 추가할 때는 배치 크기만큼만 기록하고(O(batch)),
+    정렬/중복 제거는 compact() 시점에 한 번만 수행합니다.
+    """
+
+    def __init__(self, path: str, compress: bool = False):
+        if compress and not path.endswith(".gz"):
+            path += ".gz"
+        self.path = path
+        self.compress = compress
+
+    def _open(self, mode: str):
+        if self.compress:
+            # gzip은 멤버 단위로 이어 붙여도 하나의 유효한 스트림으로 읽힙니다.
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> int:
+        """레코드들을 로그 끝에 추가하고 추가한 개수를 반환합니다."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lines = [json.dumps(r, ensure_ascii=False) + "\n" for r in records]
+        if not lines:
+            return 0
+        with self._open("a") as f:
+            f.writelines(lines)
+        return len(lines)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if not self.exists():
+            return
+        with self._open("r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # 비정상 종료로 잘린 마지막 줄은 무시
+                    continue
+
+    def compact(
+        self,
+        output_path: str,
+        key: str = "id",
+        sort_key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        reverse: bool = True,
+        base_records: Optional[List[Dict[str, Any]]] = None,
+        remove_segment: bool = True,
+        fmt: str = "json",
+        compression: Optional[str] = None,
+    ) -> int:
+        """
+        기존 레코드(base_records)와 로그를 합쳐 key 기준으로 중복을 제거하고
+        정렬한 뒤 output_path에 원자적으로 기록합니다 (ReviewWriter 형식/압축).
+
+        Returns:
+            최종 파일의 레코드 수
+        """
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for record in base_records or []:
+            merged[record.get(key)] = record
+        for record in self:
+            merged[record.get(key)] = record
+
+        records = list(merged.values())
+        if sort_key is not None:
+            records.sort(key=sort_key, reverse=reverse)
+
+        with ReviewWriter(output_path, fmt, compression) as writer:
+            writer.write(records)
+
+        if remove_segment and self.exists():
+            os.remove(self.path)
+
+        return len(records)
@@ -0,0 +1,39 @@
+# src/core/state.py
+import json
+import os
+import tempfile
+from typing import Any
+
+from src.core.config import DATA_STATE_DIR
+
+
+def state_path(site_name: str, filename: str) -> str:
+    """사이트별 상태 파일 경로 (data/state/<site>/<filename>)를 반환합니다."""
+    return os.path.join(DATA_STATE_DIR, site_name, filename)
+
+
+def load_state(path: str, default: Any = None) -> Any:
+    """JSON 상태 파일을 읽습니다. 파일이 없거나 손상되었으면 default를 반환합니다."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  상태 파일 로드 실패 ({path}): {e}")
+        return default
+
+
+def save_state(path: str, data: Any):
+    """JSON 상태 파일을 원자적으로(임시 파일 + rename) 저장합니다."""
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
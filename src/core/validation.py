@@ -0,0 +1,124 @@
+# src/core/validation.py
+"""
+API 페이지 단위 리뷰 검증.
+
+pydantic TypeAdapter(List[Model])를 사이트별로 한 번만 만들어 두고, 페이지 전체를
+한 번의 validate_python 호출로 검증합니다. 실패는 필드 경로별로 집계합니다.
+"""
+import importlib
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# 사이트별 검증 모델 (모듈 경로, 클래스 이름)
+SITE_MODELS = {
+    "apmall": ("src.sites.apmall.schemas", "ApmallReview"),
+    "naver": ("src.sites.naver.schemas", "NaverReview"),
+}
+
+
+def _field_path(loc) -> str:
+    """에러 위치에서 리스트 인덱스를 뺀 필드 경로 (예: imgList.imageFileUrl)"""
+    return ".".join(str(part) for part in loc[1:] if not isinstance(part, int)) or "<review>"
+
+
+class BatchValidator:
+    """페이지 단위 리뷰 검증기 (스레드 간 공유 가능)"""
+
+    def __init__(self, site: str):
+        from pydantic import TypeAdapter
+
+        module_name, class_name = SITE_MODELS[site]
+        model = getattr(importlib.import_module(module_name), class_name)
+        self.site = site
+        self.adapter = TypeAdapter(List[model])
+        self.checked = 0
+        self.invalid = 0
+        self.field_failures: Counter = Counter()
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def validate_page(self, records: List[Dict[str, Any]]) -> int:
+        """페이지를 검증하고 유효하지 않은 리뷰 수를 반환합니다."""
+        from pydantic import ValidationError
+
+        started = time.perf_counter()
+        failures: Counter = Counter()
+        invalid_rows = set()
+        try:
+            self.adapter.validate_python(records)
+        except ValidationError as e:
+            for error in e.errors(include_url=False, include_context=False, include_input=False):
+                loc = error.get("loc", ())
+                if loc and isinstance(loc[0], int):
+                    invalid_rows.add(loc[0])
+                failures[f"{_field_path(loc)} ({error.get('type')})"] += 1
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self.checked += len(records)
+            self.invalid += len(invalid_rows)
+            self.field_failures.update(failures)
+            self.seconds += elapsed
+        return len(invalid_rows)
+
+    @property
+    def reviews_per_second(self) -> float:
+        return self.checked / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checked": self.checked,
+                "invalid": self.invalid,
+                "reviews_per_second": round(self.reviews_per_second),
+                "field_failures": dict(self.field_failures.most_common()),
+            }
+
+    def report(self, top: int = 10) -> str:
+        with self._lock:
+            lines = [
+                f"[{self.site}] 검증: {self.checked:,}개 중 {self.invalid:,}개 실패 "
+                f"({self.reviews_per_second:,.0f} reviews/s)"
+            ]
+            for field, count in self.field_failures.most_common(top):
+                lines.append(f"   - {field}: {count:,}")
+        return "\n".join(lines)
+
+
+def create_validator(site: str) -> Optional[BatchValidator]:
+    """검증기를 만듭니다. pydantic이 없으면 경고 후 None."""
+    try:
+        return BatchValidator(site)
+    except ImportError as e:
+        print(f"[{site}] 리뷰 검증 비활성화 (pydantic 없음): {e}")
+        return None
+
+
+def run_benchmark(raw_dir: Optional[str] = None, sites: Optional[List[str]] = None, page_size: int = 20):
+    """
+    data/raw 의 기존 스냅샷을 API 페이지 크기로 나눠 검증하고
+    사이트별 처리량(reviews/s)과 필드별 실패 수를 출력합니다.
+    """
+    from src.core.config import DATA_RAW_DIR
+    from src.core.writers import read_reviews, review_output_files
+
+    raw_dir = raw_dir or DATA_RAW_DIR
+    for site in sites or list(SITE_MODELS):
+        files = review_output_files(raw_dir, site)
+        if not files:
+            print(f"[{site}] 스냅샷 없음")
+            continue
+
+        validator = BatchValidator(site)
+        load_seconds = 0.0
+        for file_path in files:
+            started = time.perf_counter()
+            reviews = read_reviews(file_path)
+            load_seconds += time.perf_counter() - started
+            for i in range(0, len(reviews), page_size):
+                validator.validate_page(reviews[i : i + page_size])
+
+        print(validator.report(top=20))
+        print(f"   파일 {len(files)}개, JSON 로드 {load_seconds:.2f}s, 검증 {validator.seconds:.2f}s")
@@ -0,0 +1,166 @@
+# src/core/writers.py
+"""
+스트리밍 리뷰 writer / reader.
+
+크롤러가 페이지 단위로 리뷰를 넘기면 바로 파일에 기록하므로, 메모리에는
+한 페이지 분량만 남습니다. 임시 파일(.part)에 쓰고 close() 때 최종 이름으로
+rename 하므로 중간에 중단되어도 반쯤 쓰인 결과 파일이 남지 않습니다.
+"""
+import glob
+import gzip
+import io
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+FORMATS = ("json", "ndjson")
+COMPRESSIONS = (None, "gzip", "zstd")
+
+_EXTENSIONS = {"json": ".json", "ndjson": ".jsonl"}
+_COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+# <site>_reviews_<상품>.json|.jsonl[.gz|.zst] (세그먼트 로그 .segments.jsonl, .part/.tmp 임시 파일 제외)
+_OUTPUT_NAME = re.compile(
+    r"_reviews_[^.]+(?:%s)(?:%s)?$"
+    % ("|".join(map(re.escape, _EXTENSIONS.values())), "|".join(map(re.escape, _COMPRESSION_EXTENSIONS.values())))
+)
+
+
+def output_filename(basename: str, fmt: str = "json", compression: Optional[str] = None) -> str:
+    """형식/압축에 맞는 확장자를 붙인 파일명"""
+    for ext in (".json", ".jsonl"):
+        if basename.endswith(ext):
+            basename = basename[: -len(ext)]
+    return basename + _EXTENSIONS[fmt] + _COMPRESSION_EXTENSIONS.get(compression, "")
+
+
+def output_basename(path: str) -> str:
+    """output_filename의 역: 압축/형식 확장자를 뗀 경로"""
+    for ext in _COMPRESSION_EXTENSIONS.values():
+        if path.endswith(ext):
+            path = path[: -len(ext)]
+    for ext in _EXTENSIONS.values():
+        if path.endswith(ext):
+            return path[: -len(ext)]
+    return path
+
+
+def review_output_files(raw_dir: str, site: str, snapshot: str = "*", product: str = "*") -> List[str]:
+    """raw_dir/<site>/<snapshot>/ 의 리뷰 결과 파일 목록 (정렬)"""
+    pattern = os.path.join(raw_dir, site, snapshot, f"{site}_reviews_{product}.*")
+    return sorted(
+        path
+        for path in glob.glob(pattern)
+        if os.path.basename(path).startswith(f"{site}_reviews_") and _OUTPUT_NAME.search(os.path.basename(path))
+    )
+
+
+def _open_binary(path: str, mode: str, compression: Optional[str]):
+    if compression == "gzip":
+        return gzip.open(path, mode)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd 압축에는 zstandard가 필요합니다: pip install zstandard") from e
+        raw = open(path, mode)
+        if "w" in mode:
+            return zstandard.ZstdCompressor(level=10).stream_writer(raw, closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return open(path, mode)
+
+
+class ReviewWriter:
+    """
+    리뷰를 페이지 단위로 받아 JSON 배열 또는 NDJSON으로 기록하는 writer.
+
+    with ReviewWriter(path, fmt="ndjson", compression="gzip") as writer:
+        writer.write(page_reviews)
+    """
+
+    def __init__(self, path: str, fmt: str = "json", compression: Optional[str] = None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}' (available: {', '.join(FORMATS)})")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}'")
+
+        self.path = path
+        self.fmt = fmt
+        self.compression = compression
+        self.count = 0
+        self._tmp_path = path + ".part"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._raw = _open_binary(self._tmp_path, "wb", compression)
+        self._out = io.TextIOWrapper(self._raw, encoding="utf-8")
+        self._closed = False
+        if fmt == "json":
+            self._out.write("[")
+
+    def write(self, records: Iterable[Dict[str, Any]]) -> int:
+        """레코드들을 기록하고 기록한 개수를 반환합니다."""
+        written = 0
+        for record in records:
+            if self.fmt == "ndjson":
+                self._out.write(json.dumps(record, ensure_ascii=False))
+                self._out.write("\n")
+            else:
+                self._out.write("\n  " if self.count == 0 else ",\n  ")
+                self._out.write(json.dumps(record, ensure_ascii=False))
+            self.count += 1
+            written += 1
+        return written
+
+    def close(self) -> str:
+        """파일을 마무리하고 최종 경로로 rename 합니다."""
+        if self._closed:
+            return self.path
+        if self.fmt == "json":
+            self._out.write("\n]\n" if self.count else "]\n")
+        self._out.close()
+        os.replace(self._tmp_path, self.path)
+        self._closed = True
+        return self.path
+
+    def abort(self):
+        """기록을 취소하고 임시 파일을 삭제합니다."""
+        if self._closed:
+            return
+        try:
+            self._out.close()
+        finally:
+            self._closed = True
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def iter_reviews(path: str) -> Iterator[Dict[str, Any]]:
+    """writer가 만든 파일(.json / .jsonl, 선택적 .gz / .zst)의 리뷰를 순서대로 읽습니다."""
+    compression = None
+    name = path
+    for kind, ext in _COMPRESSION_EXTENSIONS.items():
+        if name.endswith(ext):
+            compression = kind
+            name = name[: -len(ext)]
+
+    with io.TextIOWrapper(_open_binary(path, "rb", compression), encoding="utf-8") as f:
+        if name.endswith(".jsonl"):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def read_reviews(path: str) -> List[Dict[str, Any]]:
+    return list(iter_reviews(path))
@@ -1,3 +1,4 @@
+import json
 from typing import List, Optional, Any
 from pydantic import BaseModel, Field
 
@@ -62,3 +63,77 @@ class ApmallReview(BaseModel):
     tipDoc: Optional[str] = None
     giftServiceLimitedYn: str = "N"
     isBlock: bool = False
+
+
+# --- 컬럼형 저장소(Parquet 등)용 평탄화 ---
+
+# (컬럼명, 타입) - 타입은 src.core.review_store 의 COLUMN_TYPES 키
+FLAT_COLUMNS = [
+    ("prodReviewSn", "int64"),
+    ("prodName", "string"),
+    ("prodReviewBodyText", "string"),
+    ("prodReviewTitle", "string"),
+    ("scope", "int64"),
+    ("prodReviewTypeCode", "string"),
+    ("prodReviewRegistDt", "timestamp"),
+    ("memberSn", "int64"),
+    ("memberId", "string"),
+    ("memberStatus", "string"),
+    ("profile_nickName", "string"),
+    ("profile_gradeName", "string"),
+    ("profile_badgeName", "string"),
+    ("userAddAttrInfo", "string"),
+    ("attr_age", "string"),
+    ("attr_gender", "string"),
+    ("attr_skin_type", "string"),
+    ("attr_skin_concern", "string"),
+    ("surveys", "string"),
+    ("image_count", "int64"),
+    ("image_urls", "list<string>"),
+    ("recommendCnt", "int64"),
+    ("recommendYn", "string"),
+    ("reportCnt", "int64"),
+    ("rvAnalyticsScore", "int64"),
+    ("isBlock", "bool"),
+]
+
+
+def flatten_review(review: dict) -> dict:
+    """API 리뷰 객체를 FLAT_COLUMNS 기준의 평탄한 dict로 변환"""
+    profile = review.get("profile") or {}
+    attrs = (review.get("userAddAttrInfo") or "").split("/")
+    attrs += [None] * (4 - len(attrs))
+    images = review.get("imgList") or []
+    surveys = review.get("surveys") or []
+
+    return {
+        "prodReviewSn": review.get("prodReviewSn"),
+        "prodName": review.get("prodName"),
+        "prodReviewBodyText": review.get("prodReviewBodyText"),
+        "prodReviewTitle": review.get("prodReviewTitle"),
+        "scope": review.get("scope"),
+        "prodReviewTypeCode": review.get("prodReviewTypeCode"),
+        "prodReviewRegistDt": review.get("prodReviewRegistDt"),
+        "memberSn": review.get("memberSn"),
+        "memberId": review.get("memberId"),
+        "memberStatus": review.get("memberStatus"),
+        "profile_nickName": profile.get("nickName"),
+        "profile_gradeName": profile.get("gradeName"),
+        "profile_badgeName": profile.get("badgeName"),
+        "userAddAttrInfo": review.get("userAddAttrInfo"),
+        "attr_age": attrs[0] or None,
+        "attr_gender": attrs[1],
+        "attr_skin_type": attrs[2],
+        "attr_skin_concern": "/".join(a for a in attrs[3:] if a) or None,
+        "surveys": json.dumps(
+            {s.get("questionHeader"): s.get("responseBodyText") for s in surveys},
+            ensure_ascii=False,
+        ),
+        "image_count": len(images),
+        "image_urls": [img.get("imageFileUrl") for img in images if img.get("imageFileUrl")],
+        "recommendCnt": review.get("recommendCnt"),
+        "recommendYn": review.get("recommendYn"),
+        "reportCnt": review.get("reportCnt"),
+        "rvAnalyticsScore": review.get("rvAnalyticsScore"),
+        "isBlock": review.get("isBlock"),
+    }
@@ -0,0 +1,42 @@
+import os
+import shutil
+
+# 비정상 종료 후 남아 있으면 Chrome 실행을 막는 잠금 파일
+STALE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie")
+
+# 이 파일이 프로필 폴더에 있으면 다음 실행 때 프로필을 새로 만듦 (손으로 만들어 초기화 예약)
+INVALIDATE_MARKER = ".invalidate"
+
+
+def reset_profile(user_data_dir):
+    """프로필 폴더 삭제"""
+    if os.path.exists(user_data_dir):
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+def prepare_profile(user_data_dir, reset=False):
+    """재사용할 브라우저 프로필 준비
+
+    프로필(쿠키, HTTP 캐시)은 실행 간에 유지합니다. HTTP 캐시는 리소스 필터가
+    cdp 모드일 때만 쓰입니다 (page.route 가 켜진 컨텍스트는 캐시를 쓰지 않음). 명시적으로 reset을 요청했거나
+    무효화 표시가 있을 때만 삭제하고, 이전 실행이 남긴 잠금 파일은 정리합니다.
+
+    Returns:
+        "reset" (새로 만듦) / "warm" (기존 프로필 재사용) / "new" (처음 생성)
+    """
+    if reset or os.path.exists(os.path.join(user_data_dir, INVALIDATE_MARKER)):
+        reset_profile(user_data_dir)
+        return "reset"
+
+    if not os.path.isdir(user_data_dir):
+        return "new"
+
+    for name in STALE_LOCK_FILES:
+        path = os.path.join(user_data_dir, name)
+        if os.path.lexists(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    return "warm"
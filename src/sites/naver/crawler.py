@@ -2,14 +2,27 @@ import time
 import random
 import json
 import os
-import shutil
 import glob
+import re
+import queue
+import threading
 from datetime import datetime
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from playwright.sync_api import sync_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeout
 from src.core.base_crawler import BaseCrawler
 from src.core.config import INPUT_FILE, NAVER_CONFIG
+from src.core.state import state_path, load_state, save_state
+from src.core.segment_store import SegmentLog
+from src.core.writers import iter_reviews, output_basename, output_filename, review_output_files
+from src.core.id_index import ReviewIdIndex
+from src.core.pacing import AdaptivePacingController
+from src.sites.naver.resource_filter import ResourceFilter
+from src.sites.naver.browser_profile import prepare_profile, reset_profile
 import pandas as pd
 
+# 병렬 워커가 공유하는 카운터 보호용 락
+_progress_lock = threading.Lock()
+
 # 스텔스 스크립트 - 봇 감지 우회
 STEALTH_JS = """
 // 1. webdriver 속성 숨기기
@@ -175,16 +188,84 @@ class CrawlStats:
         return "\n".join(summary)
 
 
+def _response_latency(response):
+    """Playwright 응답의 요청 시작부터 응답 완료까지 시간 (초, 모르면 None)"""
+    try:
+        response_end = response.request.timing.get("responseEnd", -1)
+    except Exception:
+        return None
+    return response_end / 1000 if response_end > 0 else None
+
+
+def product_id_from_url(url):
+    """스마트스토어 상품 URL에서 상품 ID 추출 (없으면 "unknown")"""
+    try:
+        return (
+            url.split("/products/")[-1].split("?")[0].split("#")[0]
+            if "/products/" in url
+            else "unknown"
+        )
+    except Exception:
+        return "unknown"
+
+
 class NaverCrawler(BaseCrawler):
-    def __init__(self):
+    # 직접 호출 시 브라우저/요청 컨텍스트가 채우는 헤더
+    _UNSAFE_HEADERS = {"content-length", "cookie", "host", "connection"}
+
+    def __init__(
+        self,
+        incremental=False,
+        workers=None,
+        pacing=None,
+        headless=None,
+        reset_profile=False,
+    ):
         super().__init__(site_name="naver")
         self.collected_reviews = []
         self.saved_ids = set()
         self.current_file_path = None
+        self.segment_log = None
+        self.id_index = None
         self.unsaved_reviews = []
         self.save_batch_size = NAVER_CONFIG.get("save_batch_size", 100)
         self.stats = CrawlStats()
 
+        # 리뷰 API 직접 호출 (실패 시 페이지네이션 클릭으로 대체)
+        self.direct_api = NAVER_CONFIG.get("direct_api", True)
+        self.api_template = None
+
+        # 상품별 체크포인트 (마지막으로 처리 완료한 페이지): 상품마다 파일 하나
+        # (data/state/naver/checkpoints/<상품>.json) 라서 다른 프로세스/호스트의
+        # 작업 큐 워커와 같은 파일을 읽고-고쳐-쓰지 않음
+        self.checkpoint_dir = state_path(self.site_name, "checkpoints")
+        # 이전 버전의 통합 체크포인트 파일 (상품별 파일이 없을 때만 읽음)
+        self.legacy_checkpoints = load_state(state_path(self.site_name, "checkpoints.json"), {}) or {}
+        self.current_prod_id = None
+        self.last_processed_page = 0
+
+        # 증분 모드: 이미 수집된 리뷰만 있는 페이지가 K번 연속되면 상품 종료
+        self.incremental = incremental
+        self.incremental_stop_pages = NAVER_CONFIG.get("incremental_stop_pages", 3)
+        self.early_stop_enabled = False
+        self.consecutive_seen_pages = 0
+        self.stopped_early = False
+
+        # 병렬 크롤링: 워커 수와 모든 워커가 공유하는 적응형 페이싱/쿨다운 컨트롤러
+        self.workers = max(1, int(workers or NAVER_CONFIG.get("workers", 1)))
+        self.pacing = pacing or AdaptivePacingController(
+            NAVER_CONFIG.get("initial_pages_per_second", 0.7),
+            NAVER_CONFIG.get("min_pages_per_second", 0.1),
+            NAVER_CONFIG.get("max_pages_per_second", 2.0),
+        )
+        self.worker_name = ""
+
+        # 브라우저 프로필/기동 설정 (프로필은 실행 간 유지, 요청 시에만 초기화)
+        self.headless = NAVER_CONFIG.get("headless", False) if headless is None else headless
+        self.reset_profile = reset_profile
+        self.startup_timings = {}
+        self._startup_start = None
+
         # 오류 대응 설정 강화
         self.max_retries = 5  # 재시도 횟수 증가
         self.retry_delay = 10
@@ -198,110 +279,293 @@ class NaverCrawler(BaseCrawler):
             "denied",
         ]
 
-    def _load_existing_reviews(self, prod_id):
-        """기존에 수집된 리뷰 ID 로드 (이어서 크롤링용)"""
-        # 가장 최근 폴더에서 해당 상품의 JSON 파일 찾기
-        base_dir = os.path.join("data", "raw", "naver")
-        if not os.path.exists(base_dir):
-            return set(), []
-
-        # 날짜순으로 정렬된 폴더 목록
-        folders = sorted(
-            [
-                f
-                for f in os.listdir(base_dir)
-                if os.path.isdir(os.path.join(base_dir, f))
-            ],
+    def _snapshot_files(self, prod_id, pattern="json"):
+        """data/raw/naver 아래 상품 결과 파일(pattern="json", 모든 형식/압축) 또는 세그먼트 로그 경로 (최신 폴더 순)"""
+        if not os.path.exists(self.base_output_dir):
+            return []
+        if pattern == "json":
+            return review_output_files(
+                os.path.dirname(self.base_output_dir), self.site_name, product=prod_id
+            )[::-1]
+        suffix = ".segments.jsonl*"
+        return sorted(
+            glob.glob(
+                os.path.join(self.base_output_dir, "*", f"naver_reviews_{prod_id}{suffix}")
+            ),
             reverse=True,
         )
 
-        for folder in folders:
-            file_path = os.path.join(base_dir, folder, f"naver_reviews_{prod_id}.json")
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        existing_reviews = json.load(f)
-
-                    existing_ids = {
-                        r.get("id") for r in existing_reviews if r.get("id")
-                    }
-                    print(f"   📂 기존 데이터 발견: {file_path}")
-                    print(f"   📊 기존 리뷰: {len(existing_ids):,}개")
-                    return existing_ids, existing_reviews
-                except Exception as e:
-                    print(f"   ⚠️  기존 파일 로드 실패: {e}")
+    def _load_existing_ids(self, prod_id):
+        """기존에 수집된 리뷰 ID 로드 (이어서 크롤링용)
+
+        ID 인덱스(data/state/naver/ids/<상품>.ids)만 읽으므로 상품 크기와
+        무관하게 빠릅니다. 인덱스가 없을 때만 기존 스냅샷에서 한 번 생성합니다.
+        """
+        # 이전 실행이 중단되어 남은 세그먼트 로그가 있으면 먼저 병합
+        for segment_path in self._snapshot_files(prod_id, pattern="segments"):
+            output_path = self._output_path(segment_path.split(".segments.jsonl")[0])
+            try:
+                self.compact_product_file(output_path)
+            except Exception as e:
+                print(f"   ⚠️  세그먼트 병합 실패: {e}")
+
+        self.id_index = ReviewIdIndex(
+            state_path(self.site_name, os.path.join("ids", f"{prod_id}.ids"))
+        )
+        if self.id_index.exists():
+            existing_ids = self.id_index.load()
+            print(f"   📂 ID 인덱스: {self.id_index.path}")
+            print(f"   📊 기존 리뷰: {len(existing_ids):,}개")
+            return existing_ids
+
+        # 인덱스가 없으면 스냅샷 파일들에서 한 번만 생성
+        existing_ids = set()
+        for file_path in self._snapshot_files(prod_id):
+            try:
+                existing_ids.update(r["id"] for r in iter_reviews(file_path) if r.get("id"))
+            except Exception as e:
+                print(f"   ⚠️  기존 파일 로드 실패 ({file_path}): {e}")
 
-        return set(), []
+        if existing_ids:
+            self.id_index.rebuild(existing_ids)
+            print(f"   📂 스냅샷에서 ID 인덱스 생성: {self.id_index.path}")
+            print(f"   📊 기존 리뷰: {len(existing_ids):,}개")
+        return existing_ids
 
     def handle_response(self, response):
         """API 응답을 가로채서 리뷰 데이터를 수집"""
         try:
             url = response.url
 
-            if "/contents/reviews/query-pages" not in url:
+            if NAVER_CONFIG.get("review_api_pattern", "/contents/reviews/query-pages") not in url:
                 return
 
             if response.status != 200:
+                self.run_stats.record_request(ok=False)
+                self.pacing.record_error(response.status)
                 self.stats.add_warning(f"API returned status {response.status}")
                 return
 
+            # 직접 호출용 요청 템플릿 저장 (정렬 등 가장 최근 상태 반영)
+            self._capture_api_template(response.request)
+
             try:
-                data = response.json()
+                body = response.body()
+                self.run_stats.record_request(len(body))
+                self.pacing.record_success(_response_latency(response))
+                data = json.loads(body)
             except:
                 return
 
-            total_elements = data.get("totalElements", 0)
-            total_pages = data.get("totalPages", 0)
-            current_page = data.get("page", 0)
+            self._process_review_data(data)
 
-            if current_page == 1 and total_elements > 0:
-                self.stats.start(total_pages, total_elements)
-                print(
-                    f"\n   📋 전체 리뷰: {total_elements:,}개 ({total_pages:,}페이지)"
-                )
+        except Exception as e:
+            self.stats.add_error(f"handle_response: {type(e).__name__}: {str(e)[:50]}")
 
-            contents = data.get("contents", [])
-            if not contents:
-                return
+    def _process_review_data(self, data):
+        """리뷰 API 응답(JSON) 한 페이지를 처리
 
-            new_reviews = []
-            skipped = 0
-            for review in contents:
-                review_id = review.get("id")
+        Returns:
+            응답에 포함된 리뷰 수 (0이면 빈 페이지)
+        """
+        total_elements = data.get("totalElements", 0)
+        total_pages = data.get("totalPages", 0)
+        current_page = data.get("page", 0)
+
+        if current_page == 1 and total_elements > 0:
+            self.stats.start(total_pages, total_elements)
+            print(
+                f"\n   📋 전체 리뷰: {total_elements:,}개 ({total_pages:,}페이지)"
+            )
+        elif total_pages and not self.stats.total_pages:
+            self.stats.start(total_pages, total_elements)
 
-                if not review_id:
-                    continue
+        contents = data.get("contents", [])
+        if not contents:
+            return 0
 
-                if review_id in self.saved_ids:
-                    skipped += 1
-                    continue
+        self.last_processed_page = max(self.last_processed_page, current_page)
+        self.validate_page(contents)
+        self._mark_startup("first_review")
 
-                labels = review.get("labels", [])
-                if "BEST" in labels:
-                    continue
+        new_reviews = []
+        skipped = 0
+        for review in contents:
+            review_id = review.get("id")
 
-                new_reviews.append(review)
-                self.saved_ids.add(review_id)
+            if not review_id:
+                continue
 
-            self.stats.skipped_reviews += skipped
+            if review_id in self.saved_ids:
+                skipped += 1
+                continue
+
+            labels = review.get("labels", [])
+            if "BEST" in labels:
+                continue
+
+            new_reviews.append(review)
+            self.saved_ids.add(review_id)
+
+        self.stats.skipped_reviews += skipped
+
+        # BEST 라벨을 제외한 리뷰가 전부 이미 수집된 페이지인지 확인
+        has_regular = any("BEST" not in r.get("labels", []) for r in contents)
+        if new_reviews:
+            self.consecutive_seen_pages = 0
+        elif has_regular:
+            self.consecutive_seen_pages += 1
 
-            if new_reviews:
-                self.collected_reviews.extend(new_reviews)
-                self.unsaved_reviews.extend(new_reviews)
+        if new_reviews:
+            self.collected_reviews.extend(new_reviews)
+            self.unsaved_reviews.extend(new_reviews)
 
-                self.stats.update(current_page, len(self.collected_reviews))
+            self.stats.update(current_page, len(self.collected_reviews))
 
-                if len(self.unsaved_reviews) >= self.save_batch_size:
-                    self._save_reviews_batch()
+            if len(self.unsaved_reviews) >= self.save_batch_size:
+                self._save_reviews_batch()
 
+            print(
+                f"\r   {self.stats.get_progress_str(len(self.collected_reviews))}",
+                end="",
+                flush=True,
+            )
+
+        return len(contents)
+
+    def _should_stop_early(self):
+        """증분 모드에서 이미 본 페이지가 연속 K번 나오면 True"""
+        if not self.early_stop_enabled:
+            return False
+        if self.consecutive_seen_pages >= self.incremental_stop_pages:
+            if not self.stopped_early:
+                self.stopped_early = True
                 print(
-                    f"\r   {self.stats.get_progress_str(len(self.collected_reviews))}",
-                    end="",
-                    flush=True,
+                    f"\n   ⏹️  증분 종료: 연속 {self.consecutive_seen_pages}페이지가 모두 기존 리뷰"
+                )
+            return True
+        return False
+
+    def _capture_api_template(self, request):
+        """브라우저가 보낸 리뷰 API 요청을 직접 호출용 템플릿으로 저장"""
+        try:
+            headers = {
+                k: v
+                for k, v in request.headers.items()
+                if k.lower() not in self._UNSAFE_HEADERS and not k.startswith(":")
+            }
+            self.api_template = {
+                "url": request.url,
+                "method": request.method,
+                "headers": headers,
+                "post_data": request.post_data,
+            }
+        except Exception:
+            pass
+
+    def _build_page_request(self, page_num):
+        """템플릿 요청에서 페이지 번호만 바꾼 (url, method, headers, body) 반환"""
+        template = self.api_template
+        url = template["url"]
+        body = template["post_data"]
+
+        if body:
+            try:
+                payload = json.loads(body)
+                payload["page"] = page_num
+                body = json.dumps(payload)
+            except ValueError:
+                body = re.sub(r"(^|&)page=\d+", rf"\g<1>page={page_num}", body)
+        else:
+            parsed = urlparse(url)
+            query = parse_qs(parsed.query)
+            query["page"] = [str(page_num)]
+            url = urlunparse(parsed._replace(query=urlencode(query, doseq=True)))
+
+        return url, template["method"], template["headers"], body
+
+    def _fetch_page_direct(self, page, page_num):
+        """브라우저 세션(쿠키/헤더)을 재사용해 리뷰 API를 직접 호출
+
+        Returns:
+            응답 JSON (dict) 또는 실패 시 None
+        """
+        if not self.api_template:
+            return None
+
+        url, method, headers, body = self._build_page_request(page_num)
+
+        for attempt in range(self.pagination_retry_max):
+            self.pacing.wait()
+            started = time.monotonic()
+            try:
+                response = page.request.fetch(
+                    url, method=method, headers=headers, data=body, timeout=10000
+                )
+                content = response.body() if response.status == 200 else None
+            except PlaywrightError as e:
+                self.run_stats.record_request(ok=False)
+                self.pacing.record_error()
+                self.stats.add_warning(
+                    f"Page {page_num}: 직접 호출 실패 {type(e).__name__} ({attempt+1})"
                 )
+            else:
+                if content is not None:
+                    try:
+                        data = json.loads(content)
+                    except ValueError:
+                        # 200이지만 JSON이 아님 (캡차/HTML 페이지 등)
+                        self.run_stats.record_request(len(content), ok=False)
+                        self.pacing.record_error()
+                        self.stats.add_warning(
+                            f"Page {page_num}: 직접 호출 응답이 JSON이 아님 ({attempt+1})"
+                        )
+                    else:
+                        self.run_stats.record_request(len(content))
+                        self.pacing.record_success(time.monotonic() - started)
+                        return data
+                else:
+                    self.run_stats.record_request(ok=False)
+                    self.pacing.record_error(response.status)
+                    self.stats.add_warning(
+                        f"Page {page_num}: 직접 호출 status {response.status} ({attempt+1})"
+                    )
+                    if response.status in (401, 403, 429):
+                        return None
+            if attempt < self.pagination_retry_max - 1:
+                time.sleep(2 * (attempt + 1))
 
-        except Exception as e:
-            self.stats.add_error(f"handle_response: {type(e).__name__}: {str(e)[:50]}")
+        return None
+
+    def _crawl_pages_direct(self, page, start_page):
+        """리뷰 API를 페이지 번호로 직접 호출하며 수집
+
+        Returns:
+            (finished, last_page): 끝까지 수집했는지 여부와 마지막으로 처리한 페이지
+        """
+        current_page = start_page
+        last_done = start_page - 1
+
+        print(f"   ⚡ API 직접 호출 모드 ({start_page}페이지부터)")
+
+        while True:
+            data = self._fetch_page_direct(page, current_page)
+            if data is None:
+                return False, last_done
+
+            page_size = self._process_review_data(data)
+            last_done = current_page
+            self.stats.update(current_page, len(self.collected_reviews))
+
+            if self._should_stop_early():
+                return True, last_done
+
+            total_pages = data.get("totalPages") or self.stats.total_pages
+            if page_size == 0 or (total_pages and current_page >= total_pages):
+                print(f"\n   ✅ 마지막 페이지 도달 ({current_page}/{total_pages})")
+                return True, last_done
+
+            current_page += 1
 
     def _check_blocked(self, page):
         """차단 여부 확인"""
@@ -324,13 +588,12 @@ class NaverCrawler(BaseCrawler):
         """차단 감지 시 대응"""
         self.stats.add_error(f"🚫 차단 감지: {reason}")
         print(f"\n\n   ⚠️  차단 감지됨: {reason}")
-        print(f"   ⏳ {self.retry_delay}초 후 재시도...")
 
         if self.unsaved_reviews:
             self._save_reviews_batch()
             print(f"   💾 현재까지 수집된 데이터 저장 완료")
 
-        time.sleep(self.retry_delay)
+        self._cooldown(f"차단 감지: {reason}")
 
         try:
             page.reload(wait_until="domcontentloaded")
@@ -339,7 +602,7 @@ class NaverCrawler(BaseCrawler):
             is_blocked, _ = self._check_blocked(page)
             if is_blocked:
                 print(f"   ❌ 여전히 차단됨. 더 긴 대기 시간 적용...")
-                time.sleep(self.retry_delay * 3)
+                self._cooldown(f"차단 지속: {reason}")
                 return False
             return True
         except:
@@ -429,14 +692,18 @@ class NaverCrawler(BaseCrawler):
 
         return reached_page
 
-    def _cooldown(self, seconds, reason="차단 감지"):
-        """쿨다운 대기
+    def _cooldown(self, reason="차단 감지"):
+        """차단 신호를 페이싱에 알리고 쿨다운 대기
+
+        속도를 낮추고, 쿨다운 길이는 회복 없이 연속된 차단 횟수에 따라 늘어납니다
+        (RATE_CONTROL cooldown_base ~ cooldown_max).
 
         Args:
-            seconds: 대기 시간 (초)
             reason: 쿨다운 이유
         """
-        print(f"\n   ❄️  쿨다운: {reason}")
+        # 다른 워커들도 같은 쿨다운 동안 요청을 멈춤
+        seconds = int(self.pacing.record_block(reason))
+        print(f"\n   ❄️  쿨다운 {seconds}초: {reason} (속도 {self.pacing.rate:.2f} 페이지/초)")
         for remaining in range(seconds, 0, -10):
             print(f"   ⏳ {remaining}초 남음...", end="\r", flush=True)
             time.sleep(min(10, remaining))
@@ -450,10 +717,10 @@ class NaverCrawler(BaseCrawler):
             current_page: 현재 페이지 번호
         """
         next_page_num = current_page + 1
-        delay_min = NAVER_CONFIG.get("page_delay_min", 0.8)
-        delay_max = NAVER_CONFIG.get("page_delay_max", 1.5)
 
         for attempt in range(self.pagination_retry_max):
+            self.pacing.wait()
+
             # 스크롤을 내려서 페이지네이션 영역 확실히 로딩
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             time.sleep(0.5)
@@ -468,7 +735,7 @@ class NaverCrawler(BaseCrawler):
                         lambda r: "reviews" in r.url, timeout=10000
                     ):
                         next_num_btn.click(force=True)
-                    time.sleep(random.uniform(delay_min, delay_max))
+                    time.sleep(0.3)
                     return True, None
                 except Exception as e:
                     self.stats.add_warning(
@@ -494,7 +761,7 @@ class NaverCrawler(BaseCrawler):
                                 lambda r: "reviews" in r.url, timeout=10000
                             ):
                                 next_btn.click(force=True)
-                            time.sleep(random.uniform(delay_min, delay_max))
+                            time.sleep(0.3)
                             return True, None
                         except:
                             pass
@@ -518,7 +785,7 @@ class NaverCrawler(BaseCrawler):
                                     lambda r: "reviews" in r.url, timeout=10000
                                 ):
                                     btn.click(force=True)
-                                time.sleep(random.uniform(delay_min, delay_max))
+                                time.sleep(0.3)
                                 return True, None
                             except:
                                 pass
@@ -558,42 +825,39 @@ class NaverCrawler(BaseCrawler):
     def crawl_product(self, page, url, product_index=0, total_products=0):
         """단일 상품 크롤링 - 이어서 크롤링 지원"""
         print(f"\n{'='*60}")
-        print(f"🛒 상품 [{product_index}/{total_products}]: {url}")
+        print(f"🛒 {self.worker_name}상품 [{product_index}/{total_products}]: {url}")
         print(f"{'='*60}")
 
         self.collected_reviews = []
         self.unsaved_reviews = []
+        self.api_template = None
+        self.last_processed_page = 0
+        self.consecutive_seen_pages = 0
+        self.stopped_early = False
         self.stats.reset()
 
         # 상품 ID 추출
-        try:
-            prod_id = (
-                url.split("/products/")[-1].split("?")[0].split("#")[0]
-                if "/products/" in url
-                else "unknown"
-            )
-        except:
-            prod_id = "unknown"
+        prod_id = product_id_from_url(url)
 
         # 기존 데이터 로드 (이어서 크롤링)
-        existing_ids, existing_reviews = self._load_existing_reviews(prod_id)
-        self.saved_ids = existing_ids.copy()
+        existing_ids = self._load_existing_ids(prod_id)
+        self.saved_ids = existing_ids
+
+        self.current_prod_id = prod_id
 
-        # 스킵할 페이지 수 계산 (기존 리뷰 수 / 페이지당 20개)
-        self.skip_to_page = len(existing_ids) // 20 if existing_ids else 0
+        # 이어서 시작할 페이지: 체크포인트가 있으면 정확한 페이지, 없으면 추정치
+        self.skip_to_page = self._resume_page(prod_id, existing_ids)
 
         # 파일 경로 설정
-        filename = f"naver_reviews_{prod_id}.json"
         self._ensure_directory()
-        self.current_file_path = os.path.join(self.current_output_dir, filename)
+        self.current_file_path = self._output_path(
+            os.path.join(self.current_output_dir, f"naver_reviews_{prod_id}")
+        )
+        self.segment_log = self._segment_log_for(self.current_file_path)
 
-        # 기존 데이터가 있으면 현재 파일에 복사
-        if existing_reviews:
-            with open(self.current_file_path, "w", encoding="utf-8") as f:
-                json.dump(existing_reviews, f, ensure_ascii=False, indent=2)
-            print(f"   📋 기존 {len(existing_reviews):,}개 리뷰 로드됨")
-            if self.skip_to_page > 0:
-                print(f"   ⏩ 약 {self.skip_to_page}페이지까지 빠르게 스킵 예정")
+        # 기존 리뷰는 복사하지 않음: 이번 실행 폴더에는 신규 리뷰만 저장
+        if self.skip_to_page > 1:
+            print(f"   ⏩ {self.skip_to_page}페이지부터 이어서 수집 예정")
 
         print(f"   💾 저장 경로: {self.current_file_path}")
 
@@ -605,6 +869,7 @@ class NaverCrawler(BaseCrawler):
                 target_url = url if "#REVIEW" in url else f"{url}#REVIEW"
                 print(f"   🌐 페이지 로딩 중...")
                 page.goto(target_url, wait_until="domcontentloaded", timeout=30000)
+                self._mark_startup("first_page_load")
                 time.sleep(3)
 
                 # 차단 확인
@@ -639,6 +904,11 @@ class NaverCrawler(BaseCrawler):
                 page.mouse.wheel(0, 500)
                 time.sleep(1)
 
+                # 정렬 전 응답(랭킹순)이 증분 판정에 섞이지 않도록 초기화
+                self.consecutive_seen_pages = 0
+                # 최신순 1페이지 응답을 이미 처리했는지 (직접 호출은 이 경우에만, 2페이지부터)
+                sorted_first_page = False
+
                 sort_btn = page.locator("a:has-text('최신순')").first
                 if sort_btn.is_visible():
                     try:
@@ -646,6 +916,7 @@ class NaverCrawler(BaseCrawler):
                             lambda r: "reviews" in r.url, timeout=5000
                         ):
                             sort_btn.click(force=True)
+                        sorted_first_page = True
                     except:
                         self.stats.add_warning("최신순 정렬 응답 타임아웃")
                     time.sleep(2)
@@ -658,8 +929,26 @@ class NaverCrawler(BaseCrawler):
                 cooldown_count = 0
                 max_cooldowns = 3  # 최대 쿨다운 횟수
 
-                # 빠른 스킵: '다음' 버튼으로 10페이지씩 건너뛰기
                 skip_target = getattr(self, "skip_to_page", 0)
+
+                # API 직접 호출 우선, 실패하면 클릭 방식으로 이어서 진행
+                # 템플릿은 최신순 정렬 응답에서 캡처한 것이어야 함 (정렬 확인 실패 시 랭킹순 요청)
+                if self.direct_api and self.api_template and not sorted_first_page:
+                    print("   ⚠️ 최신순 정렬을 확인하지 못해 API 직접 호출 대신 클릭 방식으로 수집")
+                elif self.direct_api and self.api_template:
+                    start_page = max(skip_target, 2)
+                    if self._should_stop_early() or 0 < self.stats.total_pages < start_page:
+                        break
+                    finished, last_page = self._crawl_pages_direct(page, start_page)
+                    if finished:
+                        break
+                    print(
+                        f"\n   ⚠️ API 직접 호출 실패, 클릭 방식으로 전환 ({last_page}페이지)"
+                    )
+                    self.stats.add_warning(f"직접 호출 중단: page {last_page + 1}")
+                    skip_target = max(last_page, skip_target)
+
+                # 빠른 스킵: '다음' 버튼으로 10페이지씩 건너뛰기
                 if skip_target > 10:
                     current_page = self._skip_to_page(page, skip_target)
                 else:
@@ -672,6 +961,8 @@ class NaverCrawler(BaseCrawler):
                     if success:
                         current_page += 1
                         consecutive_failures = 0
+                        if self._should_stop_early():
+                            break
                     else:
                         consecutive_failures += 1
 
@@ -691,14 +982,10 @@ class NaverCrawler(BaseCrawler):
                                 )
                                 break
 
-                            # 쿨다운 시도
+                            # 쿨다운 시도 (길이는 페이싱이 연속 차단 횟수로 결정)
                             if cooldown_count < max_cooldowns:
                                 cooldown_count += 1
-                                cooldown_seconds = (
-                                    30 * cooldown_count
-                                )  # 30초, 60초, 90초
                                 self._cooldown(
-                                    cooldown_seconds,
                                     f"연속 {consecutive_failures}회 실패 (쿨다운 {cooldown_count}/{max_cooldowns})",
                                 )
 
@@ -757,7 +1044,6 @@ class NaverCrawler(BaseCrawler):
                         if is_blocked:
                             if cooldown_count < max_cooldowns:
                                 cooldown_count += 1
-                                self._cooldown(60, f"차단 감지: {reason}")
                                 if not self._handle_block(page, reason):
                                     break
                             else:
@@ -787,8 +1073,130 @@ class NaverCrawler(BaseCrawler):
         if self.unsaved_reviews:
             self._save_reviews_batch()
 
+        completed = self.stopped_early or (
+            self.stats.total_pages > 0
+            and self.last_processed_page >= self.stats.total_pages
+        )
+        self._save_checkpoint(completed=completed)
+
+        self.flush_sinks(prod_id)
+
+        # 세그먼트 로그를 정렬/중복 제거된 최종 JSON으로 병합
+        try:
+            if self.id_index is not None and self.id_index.exists():
+                self.id_index.compact()
+            total = self.compact_product_file(self.current_file_path)
+            if total is not None:
+                print(f"\n   🗜️  병합 완료: {total:,}개 리뷰 → {self.current_file_path}")
+        except Exception as e:
+            self.stats.add_error(f"세그먼트 병합 실패: {e}")
+
         # 최종 요약 출력
         print(self.stats.get_summary(len(self.collected_reviews)))
+        return completed
+
+    def _resume_page(self, prod_id, existing_ids):
+        """이어서 크롤링을 시작할 페이지 번호 계산"""
+        checkpoint = self._load_checkpoint(prod_id)
+        self.early_stop_enabled = False
+
+        # 증분 모드: 끝까지 수집된 상품은 최신 페이지부터 확인하고 조기 종료
+        if self.incremental and existing_ids and (
+            not checkpoint or checkpoint.get("completed")
+        ):
+            self.early_stop_enabled = True
+            if checkpoint:
+                self.last_processed_page = checkpoint.get("last_page", 0)
+            print(
+                f"   🔁 증분 모드: 1페이지부터, 기존 리뷰만 있는 페이지 "
+                f"{self.incremental_stop_pages}번 연속 시 종료"
+            )
+            return 1
+
+        if checkpoint and checkpoint.get("last_page"):
+            last_page = checkpoint["last_page"]
+            # 이번 실행에서 1페이지만 보고 체크포인트가 뒤로 밀리지 않도록 기준값 설정
+            self.last_processed_page = last_page
+            print(
+                f"   📌 체크포인트: {last_page:,}/{checkpoint.get('total_pages', 0):,}페이지"
+                f"{' (완료)' if checkpoint.get('completed') else ''}"
+            )
+            # 완료된 상품은 마지막 페이지만 다시 확인
+            return last_page if checkpoint.get("completed") else last_page + 1
+
+        # 체크포인트가 없으면 기존 리뷰 수 / 페이지당 20개로 추정
+        return len(existing_ids) // 20 if existing_ids else 0
+
+    def _checkpoint_path(self, prod_id):
+        return os.path.join(self.checkpoint_dir, f"{prod_id}.json")
+
+    def _load_checkpoint(self, prod_id):
+        return load_state(self._checkpoint_path(prod_id)) or self.legacy_checkpoints.get(prod_id)
+
+    def _save_checkpoint(self, completed=False):
+        """마지막으로 처리 완료한 페이지를 상품별로 기록"""
+        if not self.current_prod_id or self.last_processed_page <= 0:
+            return
+        if self.unsaved_reviews:
+            # 아직 저장되지 않은 리뷰가 있는 페이지는 완료로 보지 않음
+            return
+
+        entry = {
+            "last_page": self.last_processed_page,
+            "total_pages": self.stats.total_pages,
+            "completed": completed,
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        try:
+            # 상품은 한 번에 한 워커만 처리하므로 상품별 파일은 경합 없이 덮어씀
+            save_state(self._checkpoint_path(self.current_prod_id), entry)
+        except Exception as e:
+            self.stats.add_error(f"체크포인트 저장 실패: {e}")
+
+    def _output_path(self, base_path):
+        """확장자 없는 상품 경로에 --format / --compress 확장자를 붙인 결과 파일 경로"""
+        return os.path.join(
+            os.path.dirname(base_path),
+            output_filename(os.path.basename(base_path), self.output_format, self.output_compression),
+        )
+
+    @staticmethod
+    def _segment_log_for(file_path):
+        """상품 결과 파일에 대응하는 세그먼트 로그"""
+        return SegmentLog(
+            f"{output_basename(file_path)}.segments.jsonl",
+            compress=NAVER_CONFIG.get("segment_compress", False),
+        )
+
+    def compact_product_file(self, file_path):
+        """세그먼트 로그를 상품 결과 파일에 병합 (정렬 + 중복 제거, --format / --compress 적용)
+
+        Returns:
+            최종 리뷰 수, 병합할 세그먼트가 없으면 None
+        """
+        logs = [
+            SegmentLog(path, compress=path.endswith(".gz"))
+            for path in glob.glob(f"{output_basename(file_path)}.segments.jsonl*")
+        ]
+        if not logs:
+            return None
+
+        count = None
+        for log in logs:
+            base_records = []
+            if os.path.exists(file_path):
+                base_records = list(iter_reviews(file_path))
+
+            count = log.compact(
+                file_path,
+                key="id",
+                sort_key=lambda x: x.get("createDate", ""),
+                reverse=True,
+                base_records=base_records,
+                fmt=self.output_format,
+                compression=self.output_compression,
+            )
+        return count
 
     def _save_reviews_batch(self):
         """배치로 리뷰를 파일에 저장"""
@@ -796,101 +1204,227 @@ class NaverCrawler(BaseCrawler):
             return
 
         try:
-            if os.path.exists(self.current_file_path):
-                with open(self.current_file_path, "r", encoding="utf-8") as f:
-                    existing_reviews = json.load(f)
-            else:
-                existing_reviews = []
-
-            existing_reviews.extend(self.unsaved_reviews)
-            existing_reviews.sort(key=lambda x: x.get("createDate", ""), reverse=True)
-
-            with open(self.current_file_path, "w", encoding="utf-8") as f:
-                json.dump(existing_reviews, f, ensure_ascii=False, indent=2)
+            # 세그먼트 로그에 배치만 추가 (정렬/병합은 상품 종료 시 compact)
+            self.segment_log.append(self.unsaved_reviews)
+            self.emit_reviews(self.current_prod_id, self.unsaved_reviews)
+            if self.id_index is not None:
+                self.id_index.add(r["id"] for r in self.unsaved_reviews)
 
             saved_count = len(self.unsaved_reviews)
             self.unsaved_reviews = []
             print(f"\n   💾 배치 저장: {saved_count}개 리뷰")
 
+            # 디스크에 반영된 페이지까지 체크포인트 갱신
+            self._save_checkpoint()
+
         except Exception as e:
             self.stats.add_error(f"저장 실패: {e}")
 
-    def run(self):
-        """메인 실행"""
-        print("\n" + "=" * 60)
-        print("🚀 네이버 스마트스토어 리뷰 크롤러 시작")
-        print("=" * 60)
-
-        targets = self.get_targets()
-        if targets.empty:
-            print("❌ 크롤링 대상 없음")
-            return
-
-        total_products = len(targets)
-        print(f"\n📊 총 {total_products}개 상품 크롤링 예정")
-        print(f"💡 기존 데이터가 있으면 이어서 크롤링합니다.")
-
-        user_data_dir = os.path.join(os.getcwd(), "browser_profile")
-        if os.path.exists(user_data_dir):
-            try:
-                shutil.rmtree(user_data_dir)
-            except:
-                pass
+    def _launch_browser(self, p, user_data_dir):
+        """persistent context 실행 (프로필이 손상되어 실패하면 초기화 후 한 번 더 시도)"""
+        headless = self.headless
+        channel = NAVER_CONFIG.get("channel", "chrome")
+        if headless:
+            # 무인 실행 호스트에는 시스템 Chrome이 없을 수 있음
+            channel = NAVER_CONFIG.get("headless_channel", channel)
+
+        launch_options = dict(
+            user_data_dir=user_data_dir,
+            headless=headless,
+            viewport=NAVER_CONFIG.get("viewport", {"width": 1600, "height": 900}),
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--no-sandbox",
+            ],
+        )
+        if channel:
+            launch_options["channel"] = channel
 
-        overall_start = time.time()
-        completed_products = 0
-        total_reviews_all = 0
+        try:
+            return p.chromium.launch_persistent_context(**launch_options)
+        except Exception as e:
+            if not os.path.isdir(user_data_dir):
+                raise
+            print(f"   ⚠️  {self.worker_name}프로필 손상 의심, 초기화 후 재시도: {e}")
+            reset_profile(user_data_dir)
+            self.startup_timings["profile"] = "reset"
+            return p.chromium.launch_persistent_context(**launch_options)
+
+    def _mark_startup(self, phase):
+        """기동 단계별 소요 시간 기록 (워커 시작 기준, 최초 1회)"""
+        if self._startup_start is not None and phase not in self.startup_timings:
+            self.startup_timings[phase] = round(time.time() - self._startup_start, 2)
+
+    def _run_worker(self, url_queue, total_products, progress, profile_name):
+        """브라우저 하나로 큐에서 상품을 꺼내 순서대로 크롤링"""
+        self._startup_start = time.time()
+        user_data_dir = os.path.join(os.getcwd(), profile_name)
+        self.startup_timings["profile"] = prepare_profile(
+            user_data_dir, reset=self.reset_profile
+        )
 
         with sync_playwright() as p:
-            print("\n🌐 Chrome 브라우저 실행 중...")
+            mode = "headless" if self.headless else "headed"
+            print(
+                f"\n🌐 {self.worker_name}Chrome 브라우저 실행 중... "
+                f"({mode}, 프로필: {self.startup_timings['profile']})"
+            )
             try:
-                browser = p.chromium.launch_persistent_context(
-                    user_data_dir=user_data_dir,
-                    channel=NAVER_CONFIG.get("channel", "chrome"),
-                    headless=NAVER_CONFIG.get("headless", False),
-                    viewport=NAVER_CONFIG.get(
-                        "viewport", {"width": 1600, "height": 900}
-                    ),
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--no-sandbox",
-                    ],
-                )
+                browser = self._launch_browser(p, user_data_dir)
             except Exception as e:
-                print(f"❌ 브라우저 실행 실패: {e}")
+                print(f"❌ {self.worker_name}브라우저 실행 실패: {e}")
                 return
+            self._mark_startup("browser_launch")
+
+            # 이미지/폰트/트래커 등 리뷰 수집에 불필요한 요청 차단
+            resource_filter = ResourceFilter(NAVER_CONFIG.get("resource_filter", {}), headless=self.headless)
+            resource_filter.install(browser)
 
             page = browser.pages[0]
             page.add_init_script(STEALTH_JS)
+            # 이 페이지의 응답은 이 워커(현재 상품)의 상태로만 라우팅됨
             page.on("response", self.handle_response)
 
-            product_delay = NAVER_CONFIG.get("product_delay", 5)
+            while True:
+                # 공유 작업 큐(--queue)가 있으면 리스를 잡은 상품만, 없으면 프로세스 내 큐에서
+                job = None
+                if self.job_queue is not None:
+                    job = self.job_queue.claim(self.site_name)
+                    if job is None:
+                        break
+                    url = job.url
+                else:
+                    try:
+                        url = url_queue.get_nowait()
+                    except queue.Empty:
+                        break
 
-            for index, row in targets.iterrows():
-                try:
-                    addr_col = [c for c in targets.columns if "주소" in str(c)][0]
-                    url = row[addr_col]
-                except:
-                    continue
+                # 상품 페이지 로딩도 공유 요청 예산을 따름 (고정 상품 간 딜레이 대신)
+                self.pacing.wait()
 
-                completed_products += 1
-                self.crawl_product(page, url, completed_products, total_products)
-                total_reviews_all += len(self.collected_reviews)
+                with _progress_lock:
+                    progress["started"] += 1
+                    product_index = progress["started"]
 
-                if completed_products < total_products:
-                    print(f"\n⏳ 다음 상품까지 {product_delay}초 대기...")
-                    time.sleep(product_delay)
+                if job is None:
+                    self.crawl_product(page, url, product_index, total_products)
+                else:
+                    self.run_job(job, lambda: self.crawl_product(page, url, product_index, total_products))
+
+                with _progress_lock:
+                    progress["completed"] += 1
+                    progress["reviews"] += len(self.collected_reviews)
+                    progress["startup"][self.worker_name or "main"] = dict(
+                        self.startup_timings
+                    )
 
             browser.close()
 
-        overall_elapsed = time.time() - overall_start
-        elapsed_str = time.strftime("%H:%M:%S", time.gmtime(overall_elapsed))
+        if resource_filter.enabled:
+            print(f"\n{self.worker_name}")
+            print(resource_filter.get_summary())
 
+    def run(self):
+        """메인 실행"""
         print("\n" + "=" * 60)
-        print("🎉 전체 크롤링 완료!")
-        print("=" * 60)
-        print(f"  📦 완료 상품: {completed_products}/{total_products}")
-        print(f"  📝 신규 리뷰: {total_reviews_all:,}개")
-        print(f"  ⏱️  총 소요 시간: {elapsed_str}")
-        print(f"  📁 저장 위치: {self.current_output_dir}")
+        print("🚀 네이버 스마트스토어 리뷰 크롤러 시작")
         print("=" * 60)
+
+        targets = self.get_targets()
+        if targets.empty:
+            print("❌ 크롤링 대상 없음")
+            return
+
+        total_products = len(targets)
+        print(f"\n📊 총 {total_products}개 상품 크롤링 예정")
+        print(f"💡 기존 데이터가 있으면 이어서 크롤링합니다.")
+
+        try:
+            addr_col = [c for c in targets.columns if "주소" in str(c)][0]
+        except IndexError:
+            print("❌ '주소' 컬럼을 찾을 수 없음")
+            return
+
+        url_queue = queue.Queue()
+        for url in targets[addr_col].dropna():
+            url_queue.put(url)
+
+        if self.job_queue is not None:
+            jobs = []
+            for url in targets[addr_col].dropna():
+                prod_id = product_id_from_url(url)
+                # 상품 ID를 못 찾은 URL은 "unknown" 하나로 합쳐지지 않도록 URL을 키로 사용
+                jobs.append((url if prod_id == "unknown" else prod_id, url))
+            self.seed_jobs(jobs)
+
+        overall_start = time.time()
+        progress = {"started": 0, "completed": 0, "reviews": 0, "startup": {}}
+
+        # 예외/Ctrl+C로 중단되어도 sink(Parquet/SQLite)는 반드시 flush
+        try:
+            if self.workers > 1:
+                print(f"👥 워커 {self.workers}개 병렬 실행 (공유 페이싱)")
+                threads = []
+                for worker_id in range(1, self.workers + 1):
+                    worker = NaverCrawler(
+                        incremental=self.incremental,
+                        workers=1,
+                        pacing=self.pacing,
+                        headless=self.headless,
+                        reset_profile=self.reset_profile,
+                    )
+                    # 모든 워커가 같은 실행 폴더에 저장
+                    worker.timestamp = self.timestamp
+                    worker.current_output_dir = self.current_output_dir
+                    worker.sinks = self.sinks
+                    worker.output_format = self.output_format
+                    worker.output_compression = self.output_compression
+                    worker.validator = self.validator
+                    worker.run_stats = self.run_stats
+                    worker.job_queue = self.job_queue
+                    worker.worker_name = f"[W{worker_id}] "
+                    thread = threading.Thread(
+                        target=worker._run_worker,
+                        args=(url_queue, total_products, progress, f"browser_profile_{worker_id}"),
+                        name=f"naver-worker-{worker_id}",
+                    )
+                    thread.start()
+                    threads.append(thread)
+                    # 브라우저 동시 기동을 피하기 위해 조금씩 간격을 둠
+                    time.sleep(random.uniform(1.0, 3.0))
+                for thread in threads:
+                    thread.join()
+            else:
+                self._run_worker(url_queue, total_products, progress, "browser_profile")
+
+            completed_products = progress["completed"]
+            total_reviews_all = progress["reviews"]
+
+            overall_elapsed = time.time() - overall_start
+            elapsed_str = time.strftime("%H:%M:%S", time.gmtime(overall_elapsed))
+
+            print("\n" + "=" * 60)
+            print("🎉 전체 크롤링 완료!")
+            print("=" * 60)
+            print(f"  📦 완료 상품: {completed_products}/{total_products}")
+            print(f"  📝 신규 리뷰: {total_reviews_all:,}개")
+            print(f"  ⏱️  총 소요 시간: {elapsed_str}")
+            rate = self.pacing.snapshot()
+            print(
+                f"  🚦 요청 속도: {rate['rate']:.2f} 페이지/초 (최고 {rate['peak_rate']:.2f}, "
+                f"감속 {rate['decreases']}회, 차단 {rate['blocks']}회)"
+            )
+            for name, timings in progress["startup"].items():
+                phases = ", ".join(
+                    f"{k} {v}s" if isinstance(v, (int, float)) else f"{k}={v}"
+                    for k, v in timings.items()
+                )
+                print(f"  🚦 기동 {name.strip()}: {phases}")
+            print(f"  📁 저장 위치: {self.current_output_dir}")
+            print("=" * 60)
+        finally:
+            self.run_meta["startup_timings"] = progress["startup"]
+            self.run_meta["headless"] = self.headless
+            self.report_validation()
+            self.save_run_meta()
+            self.close_sinks()
@@ -0,0 +1,159 @@
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+
+
+class ResourceFilter:
+    """Playwright 네트워크 요청 필터
+
+    리뷰 수집에 필요 없는 리소스(이미지, 미디어, 폰트, 광고/분석 비콘)를 차단합니다.
+
+    - mode "cdp": CDP Network.setBlockedURLs 로 브라우저가 직접 차단합니다.
+      Playwright 라우팅을 쓰지 않으므로 HTTP 캐시가 그대로 동작해 유지되는 프로필의
+      캐시를 재사용할 수 있습니다. URL 와일드카드로만 차단하므로 리소스 타입은
+      type_url_patterns(확장자)로, 광고/분석은 도메인으로 지정합니다.
+      차단 목록에는 예외를 둘 수 없으므로, allow_patterns에 걸리는 요청(캡차 등)이
+      차단되면 그 페이지의 차단을 해제해 이후 요청은 모두 통과시킵니다.
+    - mode "route": context.route 로 요청마다 리소스 타입을 보고 차단합니다.
+      allow_patterns에 걸리는 요청은 항상 통과하지만, 라우팅이 켜진 컨텍스트는
+      Playwright가 HTTP 캐시를 끄므로 매 실행 모든 리소스를 새로 받습니다.
+      CDP를 쓸 수 없는 브라우저에서는 자동으로 이 방식을 사용합니다.
+    - mode "auto" (기본): headless면 cdp, headed면 route
+      (사람이 캡차를 풀 수 있는 headed 실행에서는 allow_patterns를 그대로 적용)
+    """
+
+    def __init__(self, config, headless=False):
+        self.enabled = config.get("enabled", True)
+        self.mode = config.get("mode", "auto")
+        if self.mode == "auto":
+            self.mode = "cdp" if headless else "route"
+        self.type_url_patterns = config.get("type_url_patterns", {})
+        self.resource_types = set(config.get("resource_types", []))
+        self.blocked_domains = tuple(config.get("blocked_domains", []))
+        self.allow_patterns = tuple(config.get("allow_patterns", []))
+        self.estimated_bytes = config.get("estimated_bytes", {})
+
+        self._lock = threading.Lock()
+        self.blocked_counts = defaultdict(int)
+        self.allowed_count = 0
+        self.lifted_pages = 0  # cdp 모드: allow_patterns 요청 때문에 차단을 해제한 페이지 수
+
+    def install(self, context):
+        """브라우저 컨텍스트에 필터 등록 (CDP 차단 목록 또는 라우트 핸들러)"""
+        if not self.enabled:
+            return
+        if self.mode == "cdp":
+            try:
+                for page in context.pages:
+                    self._install_cdp(context, page)
+                context.on("page", lambda page: self._install_cdp(context, page))
+                return
+            except Exception as e:
+                print(f"   ⚠️  CDP 리소스 차단 실패, page.route 로 대체 (HTTP 캐시 비활성): {e}")
+                self.mode = "route"
+        context.route("**/*", self._handle_route)
+
+    def blocked_url_patterns(self):
+        """CDP 차단 URL 패턴 (리소스 타입별 확장자 + 광고/분석 도메인)"""
+        patterns = []
+        for kind in self.resource_types:
+            patterns.extend(self.type_url_patterns.get(kind, []))
+        for domain in self.blocked_domains:
+            patterns.extend([f"*://{domain}/*", f"*://*.{domain}/*"])
+        return patterns
+
+    def _install_cdp(self, context, page):
+        session = context.new_cdp_session(page)
+        session.send("Network.enable")
+        session.send("Network.setBlockedURLs", {"urls": self.blocked_url_patterns()})
+        state = {"session": session, "lifted": False}
+        page.on("requestfailed", lambda request: self._on_request_failed(request, state))
+        page.on("requestfinished", self._on_request_finished)
+
+    def _lift_cdp(self, state, url):
+        """allow_patterns 요청이 차단되면 그 페이지의 차단 목록을 비움 (캡차 새로고침부터 통과)"""
+        if state["lifted"]:
+            return
+        state["lifted"] = True
+        try:
+            state["session"].send("Network.setBlockedURLs", {"urls": []})
+        except Exception as e:
+            print(f"   ⚠️  리소스 차단 해제 실패: {e}")
+            return
+        with self._lock:
+            self.lifted_pages += 1
+        print(f"   🔓 허용 패턴 요청이 차단되어 이 페이지의 리소스 차단을 해제합니다: {url[:80]}")
+
+    def _on_request_failed(self, request, state):
+        """CDP로 차단된 요청 집계 (net::ERR_BLOCKED_BY_CLIENT)"""
+        try:
+            if "BLOCKED_BY_CLIENT" not in (request.failure or ""):
+                return
+            if any(pattern in request.url for pattern in self.allow_patterns):
+                self._lift_cdp(state, request.url)
+            host = urlparse(request.url).netloc
+            if any(host == d or host.endswith("." + d) for d in self.blocked_domains):
+                reason = "tracker"
+            else:
+                reason = request.resource_type
+        except Exception:
+            return
+        with self._lock:
+            self.blocked_counts[reason] += 1
+
+    def _on_request_finished(self, request):
+        with self._lock:
+            self.allowed_count += 1
+
+    def _block_reason(self, request):
+        """차단 사유 (리소스 타입 또는 'tracker'), 통과시킬 요청이면 None"""
+        url = request.url
+        if any(pattern in url for pattern in self.allow_patterns):
+            return None
+
+        host = urlparse(url).netloc
+        if any(host == d or host.endswith("." + d) for d in self.blocked_domains):
+            return "tracker"
+
+        if request.resource_type in self.resource_types:
+            return request.resource_type
+
+        return None
+
+    def _handle_route(self, route):
+        try:
+            reason = self._block_reason(route.request)
+        except Exception:
+            reason = None
+
+        if reason is None:
+            with self._lock:
+                self.allowed_count += 1
+            route.continue_()
+            return
+
+        with self._lock:
+            self.blocked_counts[reason] += 1
+        route.abort()
+
+    def bytes_saved(self):
+        """차단 타입별 절감 바이트 추정치 (타입별 평균 크기 x 차단 수)"""
+        with self._lock:
+            return {
+                kind: count * self.estimated_bytes.get(kind, 0)
+                for kind, count in self.blocked_counts.items()
+            }
+
+    def get_summary(self):
+        with self._lock:
+            counts = dict(self.blocked_counts)
+            allowed = self.allowed_count
+        saved = self.bytes_saved()
+        lines = [f"  🧹 네트워크 필터 ({self.mode}): 차단 {sum(counts.values()):,}건 / 통과 {allowed:,}건"]
+        if self.lifted_pages:
+            lines.append(f"     - 허용 패턴 때문에 차단 해제한 페이지: {self.lifted_pages:,}개")
+        for kind in sorted(counts, key=counts.get, reverse=True):
+            lines.append(
+                f"     - {kind}: {counts[kind]:,}건 (약 {saved.get(kind, 0) / 1024 / 1024:.1f}MB 절감)"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,126 @@
+import json
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class ReviewAttach(BaseModel):
+    id: int = Field(..., description="첨부 고유 번호")
+    reviewAttachmentType: str = Field(..., description="첨부 유형 (I: 이미지, V: 동영상)")
+    attachUrl: str = Field(..., description="첨부 URL")
+    attachWidth: Optional[int] = None
+    attachHeight: Optional[int] = None
+    attachSize: Optional[int] = None
+    sortOrder: Optional[int] = None
+
+
+class ReviewUserInfoValue(BaseModel):
+    itemId: int = Field(..., description="속성 항목 번호 (피부타입, 고민 등)")
+    itemOptionId: Optional[int] = None
+    itemValue: str = Field(..., description="속성 값 (예: 복합성)")
+
+
+class ReviewTopic(BaseModel):
+    topicCode: str
+    topicCodeName: str = Field(..., description="토픽 이름 (예: 용량)")
+    patternStartNo: Optional[int] = None
+    patternEndNo: Optional[int] = None
+
+
+class NaverReview(BaseModel):
+    # --- 식별자 ---
+    id: int = Field(..., description="리뷰 고유 번호")
+    productNo: str = Field(..., description="상품 번호")
+    productName: str = Field(..., description="상품명")
+    parentReviewId: Optional[int] = Field(None, description="원 리뷰 번호 (한달사용 리뷰 등)")
+
+    # --- 리뷰 내용 ---
+    reviewContent: str = Field(..., description="리뷰 본문")
+    reviewScore: int = Field(..., ge=1, le=5, description="평점 (1~5)")
+    createDate: str = Field(..., description="작성 일시")
+    modifyDate: Optional[str] = None
+    reviewType: str = Field(..., description="리뷰 유형 (NORMAL, AFTER_USE 등)")
+    reviewContentClassType: str = Field(..., description="TEXT / PHOTO / VIDEO")
+    reviewServiceType: Optional[str] = None
+    productOptionContent: Optional[str] = None
+
+    # --- 작성자 정보 ---
+    maskedWriterId: Optional[str] = None
+    reviewUserInfoValues: List[ReviewUserInfoValue] = Field(default_factory=list)
+
+    # --- 상세 데이터 ---
+    reviewAttaches: List[ReviewAttach] = Field(default_factory=list)
+    reviewTopics: List[ReviewTopic] = Field(default_factory=list)
+    reviewEvaluationValueIds: List[int] = Field(default_factory=list)
+    labels: List[str] = Field(default_factory=list)
+
+    # --- 메타 데이터 ---
+    repurchase: bool = False
+    freeTrial: bool = False
+    helpCount: Optional[int] = None
+    reviewRankingScore: Optional[float] = None
+
+
+# --- 컬럼형 저장소(Parquet 등)용 평탄화 ---
+
+# (컬럼명, 타입) - 타입은 src.core.review_store 의 COLUMN_TYPES 키
+FLAT_COLUMNS = [
+    ("id", "int64"),
+    ("productNo", "string"),
+    ("productName", "string"),
+    ("productOptionContent", "string"),
+    ("reviewScore", "int64"),
+    ("reviewContent", "string"),
+    ("createDate", "timestamp"),
+    ("modifyDate", "timestamp"),
+    ("reviewType", "string"),
+    ("reviewServiceType", "string"),
+    ("reviewContentClassType", "string"),
+    ("parentReviewId", "int64"),
+    ("maskedWriterId", "string"),
+    ("repurchase", "bool"),
+    ("freeTrial", "bool"),
+    ("helpCount", "int64"),
+    ("reviewRankingScore", "double"),
+    ("attach_count", "int64"),
+    ("attach_urls", "list<string>"),
+    ("user_info", "list<string>"),
+    ("topics", "list<string>"),
+    ("evaluation_value_ids", "string"),
+]
+
+
+def flatten_review(review: dict) -> dict:
+    """리뷰 API 객체를 FLAT_COLUMNS 기준의 평탄한 dict로 변환"""
+    attaches = review.get("reviewAttaches") or []
+    return {
+        "id": review.get("id"),
+        "productNo": review.get("productNo"),
+        "productName": review.get("productName"),
+        "productOptionContent": review.get("productOptionContent"),
+        "reviewScore": review.get("reviewScore"),
+        "reviewContent": review.get("reviewContent"),
+        "createDate": review.get("createDate"),
+        "modifyDate": review.get("modifyDate"),
+        "reviewType": review.get("reviewType"),
+        "reviewServiceType": review.get("reviewServiceType"),
+        "reviewContentClassType": review.get("reviewContentClassType"),
+        "parentReviewId": review.get("parentReviewId"),
+        "maskedWriterId": review.get("maskedWriterId"),
+        "repurchase": review.get("repurchase"),
+        "freeTrial": review.get("freeTrial"),
+        "helpCount": review.get("helpCount"),
+        "reviewRankingScore": review.get("reviewRankingScore"),
+        "attach_count": len(attaches),
+        "attach_urls": [a.get("attachUrl") for a in attaches if a.get("attachUrl")],
+        "user_info": [
+            v.get("itemValue")
+            for v in review.get("reviewUserInfoValues") or []
+            if v.get("itemValue")
+        ],
+        "topics": [
+            t.get("topicCodeName")
+            for t in review.get("reviewTopics") or []
+            if t.get("topicCodeName")
+        ],
+        "evaluation_value_ids": json.dumps(review.get("reviewEvaluationValueIds") or []),
+    }
@@ -0,0 +1,53 @@
+import json
+import os
+
+import pytest
+
+from src.analysis.trends import TrendAnalyzer, aggregate_path, load_aggregates
+
+
+def write_snapshot(raw_dir, site, reviews):
+    directory = os.path.join(raw_dir, site, "2024-01-01_000000")
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{site}_reviews_1.json"), "w", encoding="utf-8") as f:
+        json.dump(reviews, f, ensure_ascii=False)
+
+
+@pytest.fixture
+def raw_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("src.core.state.DATA_STATE_DIR", str(tmp_path / "state"))
+    raw = tmp_path / "raw"
+    write_snapshot(
+        str(raw),
+        "apmall",
+        [
+            {"prodReviewSn": i, "prodReviewRegistDt": "2024-01-01T10:00:00", "scope": 5, "prodReviewBodyText": "좋아요", "imgList": []}
+            for i in range(1, 4)
+        ],
+    )
+    write_snapshot(
+        str(raw),
+        "naver",
+        [
+            {"id": i, "createDate": "2024-01-01T10:00:00", "reviewScore": 4, "reviewContent": "촉촉해요", "reviewAttaches": []}
+            for i in range(1, 6)
+        ],
+    )
+    return str(raw)
+
+
+def site_counts(output_dir):
+    aggregates = load_aggregates(output_dir)
+    return aggregates.groupby("site")["count"].sum().to_dict()
+
+
+def test_subset_run_after_missing_aggregate_keeps_other_sites(raw_dir, tmp_path):
+    output_dir = str(tmp_path / "analysis")
+    TrendAnalyzer(raw_dir, output_dir).update()
+    assert site_counts(output_dir) == {"apmall": 3, "naver": 5}
+
+    # 집계 파일이 지워진 뒤 일부 사이트만 돌리고, 다시 전체를 돌려도 다른 사이트가 빠지지 않아야 함
+    os.remove(aggregate_path(output_dir))
+    assert TrendAnalyzer(raw_dir, output_dir).update(["apmall"]) == {"apmall": 3}
+    assert TrendAnalyzer(raw_dir, output_dir).update() == {"apmall": 0, "naver": 5}
+    assert site_counts(output_dir) == {"apmall": 3, "naver": 5}